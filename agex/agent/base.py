@@ -1,3 +1,4 @@
+import sys
 import uuid
 from typing import Any, Callable, Dict, Literal
 
@@ -21,13 +22,12 @@ def register_agent(agent: "BaseAgent") -> str:
 
     Returns the agent's fingerprint.
     """
-    # Enforce unique agent names if provided
-    if hasattr(agent, "name") and agent.name is not None:
-        if agent.name in _AGENT_REGISTRY_BY_NAME:
-            existing_agent = _AGENT_REGISTRY_BY_NAME[agent.name]
-            if existing_agent is not agent:  # Allow re-registration of same agent
-                raise ValueError(f"Agent name '{agent.name}' already exists")
-        _AGENT_REGISTRY_BY_NAME[agent.name] = agent
+    # Enforce unique agent names if provided (single dict probe)
+    name = getattr(agent, "name", None)
+    if name is not None:
+        existing_agent = _AGENT_REGISTRY_BY_NAME.setdefault(name, agent)
+        if existing_agent is not agent:  # Allow re-registration of same agent
+            raise ValueError(f"Agent name '{name}' already exists")
 
     fingerprint = compute_agent_fingerprint_from_policy(agent)
     _AGENT_REGISTRY[fingerprint] = agent
@@ -54,9 +54,8 @@ def clear_agent_registry() -> None:
     """Clear the global registry. Primarily for testing."""
     from .task import clear_dynamic_dataclass_registry
 
-    global _AGENT_REGISTRY, _AGENT_REGISTRY_BY_NAME
-    _AGENT_REGISTRY = {}
-    _AGENT_REGISTRY_BY_NAME = {}
+    _AGENT_REGISTRY.clear()
+    _AGENT_REGISTRY_BY_NAME.clear()
     clear_dynamic_dataclass_registry()
 
 
@@ -79,7 +78,8 @@ class BaseAgent:
         llm_max_retries: int = 2,
         llm_retry_backoff: float = 0.25,
     ):
-        self.name = name or _random_name()
+        # Interned: the name keys the registry and prefixes every state key
+        self.name = sys.intern(name or _random_name())
         self.primer = primer
         self.timeout_seconds = timeout_seconds
         self.max_iterations = max_iterations
@@ -96,12 +96,30 @@ class BaseAgent:
 
         self._policy: AgentPolicy = AgentPolicy()
 
+        # Last rendered system message, keyed by primer; cleared on registration
+        self._system_message_cache: tuple[str | None, str] | None = None
+
         # Auto-register this agent
-        self.fingerprint = register_agent(self)
+        self._fingerprint: str | None = register_agent(self)
+
+    @property
+    def fingerprint(self) -> str:
+        """
+        Hash of the agent's primer and capabilities, registered for resolution.
+
+        Computed on first read after a registration change, so a run of
+        registrations hashes the policy once rather than once per call.
+        """
+        if self._fingerprint is None:
+            self._fingerprint = register_agent(self)
+        return self._fingerprint
 
     def _update_fingerprint(self):
-        """Update the fingerprint after registration changes."""
-        self.fingerprint = register_agent(self)
+        """Mark the fingerprint and rendered system message stale."""
+        self._fingerprint = None
+        # The fingerprint omits signatures and live objects, so it can't key
+        # the rendered definitions; any registration invalidates them
+        self._system_message_cache = None
 
     def module(
         self,
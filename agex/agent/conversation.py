@@ -16,10 +16,14 @@ from agex.agent.events import (
     SuccessEvent,
     TaskStartEvent,
 )
-from agex.llm.core import Message, TextMessage
+from agex.llm.core import ImagePart, Message, MultimodalMessage, TextMessage, TextPart
 from agex.render.context import ContextRenderer
+from agex.render.value import ValueRenderer
 from agex.state.core import State
 
+# Renderer for task results echoed back into the conversation
+_RESULT_RENDERER = ValueRenderer(max_len=200, max_depth=2)
+
 
 def conversation_log(
     state: State, system_message: str, agent: BaseAgent
@@ -57,8 +61,6 @@ def conversation_log(
             context_parts = context_renderer.render_events([event], agent.max_tokens)
             if context_parts:
                 # Check if there are any non-text parts (e.g., ImageParts)
-                from agex.llm.core import ImagePart, MultimodalMessage, TextPart
-
                 has_non_text_parts = any(
                     isinstance(part, ImagePart) for part in context_parts
                 )
@@ -79,10 +81,7 @@ def conversation_log(
 
         elif isinstance(event, SuccessEvent):
             # Agent success → assistant message (with safe rendering)
-            from agex.render.value import ValueRenderer
-
-            renderer = ValueRenderer(max_len=200, max_depth=2)
-            rendered_result = renderer.render(event.result)
+            rendered_result = _RESULT_RENDERER.render(event.result)
             assistant_content = f"✅ Task completed successfully: {rendered_result}"
             messages.append(TextMessage(role="assistant", content=assistant_content))
 
@@ -59,6 +59,28 @@ class LLMFail(_AgentExit):
     retries: int = 0
 
 
+class _AgexMeta:
+    """Decorator metadata attached once to functions by @agent.fn and @agent.task."""
+
+    __slots__ = ("is_fn", "owners", "namespace")
+
+    def __init__(self) -> None:
+        self.is_fn = False
+        self.owners: list[Any] = []
+        self.namespace: str | None = None
+
+    @property
+    def state(self) -> int:
+        """Decorator state: bit 0 is set by @agent.fn, bit 1 by @agent.task."""
+        return self.is_fn | (self.namespace is not None) << 1
+
+
+def _task_namespace(obj: Any) -> str | None:
+    """Return the namespace of an @agent.task callable, or None for anything else."""
+    meta = getattr(obj, "__agex_meta__", None)
+    return meta.namespace if meta is not None else None
+
+
 @dataclass
 class MemberSpec:
     visibility: Visibility | None = None
@@ -38,6 +38,16 @@ from agex.render.definitions import render_definitions
 from agex.state import Live, Namespaced, Versioned, events
 from agex.state.log import add_event_to_log
 
+# Match an opening fence (optionally with a language tag) and a closing fence at the end.
+# Capture the body in between in a non-greedy way.
+# Leading whitespace is part of the pattern so the raw code can be matched in a
+# single pass; unfenced code fails on its first non-whitespace character.
+_CODE_FENCE_RE = re.compile(r"\s*```[A-Za-z0-9_+-]*\s*\n([\s\S]*?)\n```\s*$")
+
+# Input values of these types are immutable, so the task start event can hold
+# them directly instead of taking a deepcopy.
+_IMMUTABLE_INPUT_TYPES = frozenset({int, float, complex, str, bytes, bool, type(None)})
+
 
 class TaskLoopMixin(BaseAgent):
     @staticmethod
@@ -51,15 +61,7 @@ class TaskLoopMixin(BaseAgent):
         if not isinstance(code, str):
             return code
 
-        text = code.strip()
-        # Quick check for starting and ending fences
-        if not text.startswith("```"):
-            return code
-
-        # Match an opening fence (optionally with a language tag) and a closing fence at the end
-        # Capture the body in between in a non-greedy way
-        pattern = r"^```[A-Za-z0-9_+-]*\s*\n([\s\S]*?)\n```\s*$"
-        match = re.match(pattern, text)
+        match = _CODE_FENCE_RE.match(code)
         if match:
             body = match.group(1)
             return body
@@ -114,10 +116,8 @@ class TaskLoopMixin(BaseAgent):
             exec_state.set("inputs", inputs_instance)
         exec_state.set("__expected_return_type__", return_type)
 
-        # Initialize the event log if it doesn't exist
-        if "__event_log__" not in exec_state:
-            exec_state.set("__event_log__", [])
-
+        # The event log itself is created by add_event_to_log on the first
+        # event (the TaskStartEvent below), so no separate initializing write.
         events_yielded = len(events(exec_state))  # type: ignore
 
         # Build system message (always static, never stored in state)
@@ -133,7 +133,12 @@ class TaskLoopMixin(BaseAgent):
             agent_name=self.name,
             task_name=task_name,
             inputs={
-                f.name: deepcopy(getattr(inputs_instance, f.name))
+                f.name: (
+                    value
+                    if type(value := getattr(inputs_instance, f.name))
+                    in _IMMUTABLE_INPUT_TYPES
+                    else deepcopy(value)
+                )
                 for f in inputs_dataclass.__dataclass_fields__.values()
             },
             message=initial_task_message,
@@ -446,6 +451,11 @@ class TaskLoopMixin(BaseAgent):
 
     def _build_system_message(self) -> str:
         """Build the system message with builtin primer, registered resources, and agent primer."""
+        # Registrations clear the cache; the primer may be reassigned directly
+        cached = self._system_message_cache
+        if cached is not None and cached[0] == self.primer:
+            return cached[1]
+
         parts = []
 
         # Add builtin primer first (foundation)
@@ -461,7 +471,9 @@ class TaskLoopMixin(BaseAgent):
         if self.primer:
             parts.append(self.primer)
 
-        return "\n\n".join(parts)
+        system_message = "\n\n".join(parts)
+        self._system_message_cache = (self.primer, system_message)
+        return system_message
 
     def _build_task_message(
         self,
@@ -309,19 +309,21 @@ def describe_namespace(
         if parent.kind == "module":
             # Intersect parent's allowed view with child's include/exclude
             parent_view = describe_namespace(parent, include_low)
-            for name, desc in parent_view.items():
+            # The parent module is the same for every member; resolve it once
+            try:
+                parent_mod = parent._ensure_module_loaded()
+                dotted_prefix = parent_mod.__name__
+            except Exception:
+                parent_mod = None
                 dotted_prefix = None
-                try:
-                    dotted_prefix = parent._ensure_module_loaded().__name__
-                except Exception:
-                    dotted_prefix = None
+            for name, desc in parent_view.items():
                 if not include_key(name, dotted_prefix):
                     continue
                 # Keep parent's kind/doc; apply child's effective visibility if configured
                 eff_vis = _effective_visibility(ns, name)
                 if desc.kind == "class":
                     # Re-describe class members with child's ns for dotted filters
-                    cls_obj = getattr(parent._ensure_module_loaded(), name, None)
+                    cls_obj = getattr(parent_mod, name, None)
                     if inspect.isclass(cls_obj):
                         result[name] = describe_class(cls_obj, ns, include_low)
                     else:
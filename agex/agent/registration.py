@@ -1,4 +1,3 @@
-import inspect
 from types import ModuleType
 from typing import Any, Callable, TypeVar, overload
 
@@ -8,9 +7,8 @@ from agex.agent.datatypes import (
     MemberSpec,
     Pattern,
     Visibility,
+    _AgexMeta,
 )
-from agex.agent.policy.resolve import make_predicate
-from agex.agent.utils import get_instance_attributes_from_init
 from agex.eval.functions import UserFunction
 from agex.eval.objects import AgexModule
 
@@ -19,6 +17,18 @@ F = TypeVar("F", bound=Callable[..., Any])
 
 
 class RegistrationMixin(BaseAgent):
+    def _validate_name(self, name: str) -> None:
+        """
+        Raise ValueError if `name` is reserved.
+
+        This is the single reserved-name check shared by `fn`, `cls`, `module`,
+        and instance registration, so each registration validates its name
+        exactly once. Interning is left to AgentPolicy, which owns the registry
+        keys.
+        """
+        if name in RESERVED_NAMES:
+            raise ValueError(f"The name '{name}' is reserved and cannot be registered.")
+
     @overload
     def fn(
         self,
@@ -58,10 +68,7 @@ class RegistrationMixin(BaseAgent):
             if isinstance(f, UserFunction):
                 # Special case: registering a UserFunction from parent agent
                 final_name = name or f.name
-                if final_name in RESERVED_NAMES:
-                    raise ValueError(
-                        f"The name '{final_name}' is reserved and cannot be registered."
-                    )
+                self._validate_name(final_name)
 
                 # Create wrapper that preserves UserFunction call semantics
                 def user_function_wrapper(*args, **kwargs):
@@ -95,10 +102,7 @@ class RegistrationMixin(BaseAgent):
             else:
                 # Normal case: real Python function
                 final_name = name or f.__name__
-                if final_name in RESERVED_NAMES:
-                    raise ValueError(
-                        f"The name '{final_name}' is reserved and cannot be registered."
-                    )
+                self._validate_name(final_name)
                 final_doc = docstring if docstring is not None else f.__doc__
                 self._policy.register_fn(
                     func=f,
@@ -112,10 +116,11 @@ class RegistrationMixin(BaseAgent):
                 # Mark as fn-decorated for dual-decorator validation (allow multiple fn decorators)
                 # Only set attributes if the function allows it (built-ins don't)
                 try:
-                    if not hasattr(f, "__agent_fn_owners__"):
-                        f.__agent_fn_owners__ = []
-                    f.__agent_fn_owners__.append(self)
-                    f.__is_agent_fn__ = True  # Keep this for task decorator to detect
+                    meta = getattr(f, "__agex_meta__", None)
+                    if meta is None:
+                        meta = f.__agex_meta__ = _AgexMeta()
+                    meta.is_fn = True
+                    meta.owners.append(self)
                 except (AttributeError, TypeError):
                     # Built-in functions and some other types don't allow setting attributes
                     # This is fine - they can't be task-decorated anyway, so no validation needed
@@ -169,62 +174,7 @@ class RegistrationMixin(BaseAgent):
 
         def decorator(c: T) -> T:
             final_name = name or c.__name__
-            if final_name in RESERVED_NAMES:
-                raise ValueError(
-                    f"The name '{final_name}' is reserved and cannot be registered."
-                )
-
-            # 1. Generate all possible members
-            all_members = {
-                name
-                for name, member in inspect.getmembers(c)
-                if not name.startswith("__") or name == "__init__"
-            }.union(getattr(c, "__annotations__", {}))
-
-            # Add instance attributes from __init__ method when using wildcard patterns
-            if include == "*" or (isinstance(include, str) and "*" in include):
-                instance_attrs = get_instance_attributes_from_init(c)
-                all_members.update(instance_attrs)
-
-            if isinstance(include, (list, set)):
-                # Explicitly add the included names, as they might be instance attributes
-                # not found by inspect.getmembers on the class.
-                all_members.update(include)
-
-            # 2. Filter members based on include/exclude patterns
-            include_pred = make_predicate(include)
-            exclude_pred = make_predicate(exclude)
-            selected_names = {
-                name
-                for name in all_members
-                if include_pred(name) and not exclude_pred(name)
-            }
-
-            # 3. Create MemberSpec objects and apply configurations
-            final_attrs: dict[str, MemberSpec] = {}
-            final_methods: dict[str, MemberSpec] = {}
-
-            # Handle __init__ separately based on `constructable` flag
-            if constructable:
-                selected_names.add("__init__")
-            elif "__init__" in selected_names:
-                selected_names.remove("__init__")
-
-            for member_name in selected_names:
-                config = final_configure.get(member_name, MemberSpec())
-                vis = config.visibility or visibility
-                doc = config.docstring
-
-                # Check if the member is a method/routine on the class
-                if hasattr(c, member_name) and inspect.isroutine(
-                    getattr(c, member_name)
-                ):
-                    final_methods[member_name] = MemberSpec(
-                        visibility=vis, docstring=doc
-                    )
-                # If it's not a method, and it was in the include list, treat it as a data attribute
-                else:
-                    final_attrs[member_name] = MemberSpec(visibility=vis, docstring=doc)
+            self._validate_name(final_name)
 
             sec_final_configure = {
                 k: MemberSpec(
@@ -272,12 +222,8 @@ class RegistrationMixin(BaseAgent):
                 raise TypeError(
                     "The 'recursive' option is only supported for module registration, not for class instances."
                 )
-            # Validate reserved names
-            final_name = name or (obj.__name__ if isinstance(obj, ModuleType) else None)
-            if final_name in RESERVED_NAMES:
-                raise ValueError(
-                    f"The name '{final_name}' is reserved and cannot be registered."
-                )
+            final_name = name or obj.__name__
+            self._validate_name(final_name)
             sec_configure = {
                 k: MemberSpec(
                     visibility=v.visibility,
@@ -287,7 +233,7 @@ class RegistrationMixin(BaseAgent):
                 for k, v in (configure or {}).items()
             }
             self._policy.register_module(
-                name=name,
+                name=final_name,
                 module=obj,
                 visibility=visibility,
                 include=include,
@@ -308,10 +254,7 @@ class RegistrationMixin(BaseAgent):
                 from agex.agent.policy.datatypes import Namespace
 
                 final_name = name or obj.name
-                if final_name in RESERVED_NAMES:
-                    raise ValueError(
-                        f"The name '{final_name}' is reserved and cannot be registered."
-                    )
+                self._validate_name(final_name)
                 child_ns = Namespace(
                     name=final_name,
                     kind="inherited",
@@ -328,12 +271,8 @@ class RegistrationMixin(BaseAgent):
 
         # Check if we're dealing with a module or an instance
         elif isinstance(obj, ModuleType):
-            # Validate reserved names
             final_name = name or obj.__name__
-            if final_name in RESERVED_NAMES:
-                raise ValueError(
-                    f"The name '{final_name}' is reserved and cannot be registered."
-                )
+            self._validate_name(final_name)
             sec_configure = {
                 k: MemberSpec(
                     visibility=(v.visibility if v is not None else None),
@@ -343,7 +282,7 @@ class RegistrationMixin(BaseAgent):
                 for k, v in (configure or {}).items()
             }
             self._policy.register_module(
-                name=name,
+                name=final_name,
                 module=obj,
                 visibility=visibility,
                 include=include,
@@ -365,12 +304,9 @@ class RegistrationMixin(BaseAgent):
                 raise TypeError(
                     "The 'name' parameter is required when registering an instance object."
                 )
-            if name in RESERVED_NAMES:
-                raise ValueError(
-                    f"The name '{name}' is reserved and cannot be registered."
-                )
+            self._validate_name(name)
             self._policy.register_instance(
-                name=name if name is not None else "",
+                name=name,
                 obj=obj,
                 visibility=visibility,
                 include=include,
@@ -10,6 +10,7 @@ from dataclasses import make_dataclass
 from typing import Any, Callable
 
 from agex.agent.base import BaseAgent
+from agex.agent.datatypes import _AgexMeta, _task_namespace
 from agex.agent.loop import TaskLoopMixin
 from agex.agent.utils import is_function_body_empty
 from agex.eval.validation import validate_with_sampling
@@ -17,6 +18,8 @@ from agex.eval.validation import validate_with_sampling
 # Global registry for dynamically created input dataclasses
 # This allows pickle to find them by module.classname lookup
 _DYNAMIC_DATACLASS_REGISTRY: dict[str, type] = {}
+# Keyword arguments every task accepts in addition to its own parameters
+_CALL_CONTROL_KWARGS = frozenset({"state", "on_event"})
 
 
 def clear_dynamic_dataclass_registry() -> None:
@@ -29,6 +32,37 @@ def clear_dynamic_dataclass_registry() -> None:
     _DYNAMIC_DATACLASS_REGISTRY.clear()
 
 
+_MULTI_TASK_ERROR = (
+    "Function '{name}' already has a task decorator (namespace: '{namespace}'). "
+    "Multi-agent tasks are not supported."
+)
+_DECORATOR_ORDER_ERROR = (
+    "Invalid decorator order on '{name}'. "
+    "@agent.fn() must be applied AFTER @agent.task(), not before.\n"
+    "Correct order:\n"
+    "@agent.fn()\n"
+    "@agent.task('...')\n"
+    "def {name}(): ..."
+)
+_NON_EMPTY_BODY_ERROR = (
+    "Function '{name}' decorated with @task must have an empty body. "
+    "The agent will provide the implementation."
+)
+_MISSING_INSTRUCTIONS_ERROR = (
+    "Function '{name}' decorated with @task must have either "
+    "a primer argument or a non-empty docstring to provide agent instructions."
+)
+
+# Task decorator validation table, indexed by `_AgexMeta.state`
+# (bit 0: @agent.fn applied, bit 1: @agent.task applied).
+_TASK_DECORATOR_ERRORS: tuple[str | None, ...] = (
+    None,  # undecorated
+    _DECORATOR_ORDER_ERROR,  # fn must be the outer decorator
+    _MULTI_TASK_ERROR,  # no multi-agent tasks
+    _MULTI_TASK_ERROR,  # dual-decorated task
+)
+
+
 class TaskMixin(TaskLoopMixin, BaseAgent):
     def run_task(
         self,
@@ -55,7 +89,7 @@ class TaskMixin(TaskLoopMixin, BaseAgent):
         """
         from agex.state import Namespaced
 
-        namespace = getattr(task_callable, "__agex_task_namespace__", self.name)
+        namespace = _task_namespace(task_callable) or self.name
         child_state = Namespaced(parent_state, namespace)
 
         # Prepare kwargs safely
@@ -173,24 +207,13 @@ class TaskMixin(TaskLoopMixin, BaseAgent):
 
     def _validate_task_decorator(self, func: Callable) -> None:
         """Validate that task decorator is being used correctly."""
-        # 1. Prevent multiple task decorators (no multi-agent tasks)
-        if hasattr(func, "__agex_task_namespace__"):
-            existing_namespace = func.__agex_task_namespace__
-            raise ValueError(
-                f"Function '{func.__name__}' already has a task decorator (namespace: '{existing_namespace}'). "
-                f"Multi-agent tasks are not supported."
-            )
+        meta = getattr(func, "__agex_meta__", None)
+        if meta is None:
+            return
 
-        # 2. Prevent wrong decorator order (fn must be outer)
-        if hasattr(func, "__is_agent_fn__"):
-            raise ValueError(
-                f"Invalid decorator order on '{func.__name__}'. "
-                f"@agent.fn() must be applied AFTER @agent.task(), not before.\n"
-                f"Correct order:\n"
-                f"@agent.fn()\n"
-                f"@agent.task('...')\n"
-                f"def {func.__name__}(): ..."
-            )
+        error = _TASK_DECORATOR_ERRORS[meta.state]
+        if error is not None:
+            raise ValueError(error.format(name=func.__name__, namespace=meta.namespace))
 
     def _create_task_wrapper(
         self, func: Callable, primer: str | None, setup: str | None = None
@@ -207,10 +230,7 @@ class TaskMixin(TaskLoopMixin, BaseAgent):
         """
         # Validate that the function body is empty
         if not is_function_body_empty(func):
-            raise ValueError(
-                f"Function '{func.__name__}' decorated with @task must have an empty body. "
-                "The agent will provide the implementation."
-            )
+            raise ValueError(_NON_EMPTY_BODY_ERROR.format(name=func.__name__))
 
         # Capture original function metadata
         original_sig = inspect.signature(func)
@@ -224,10 +244,7 @@ class TaskMixin(TaskLoopMixin, BaseAgent):
         else:
             # Fall back to function docstring
             if func.__doc__ is None or func.__doc__.strip() == "":
-                raise ValueError(
-                    f"Function '{func.__name__}' decorated with @task must have either "
-                    "a primer argument or a non-empty docstring to provide agent instructions."
-                )
+                raise ValueError(_MISSING_INSTRUCTIONS_ERROR.format(name=func.__name__))
             effective_docstring = func.__doc__.strip()
 
         # Create dynamic dataclass for inputs
@@ -267,6 +284,48 @@ class TaskMixin(TaskLoopMixin, BaseAgent):
 
         new_sig = original_sig.replace(parameters=new_params)
 
+        # Resolve parameter annotations once at decoration time so each call
+        # only binds arguments and validates them.
+        param_annotations = {
+            name: (
+                Any if param.annotation is inspect.Parameter.empty else param.annotation
+            )
+            for name, param in original_sig.parameters.items()
+        }
+
+        takes_no_args = not original_sig.parameters
+
+        def bind_call(args: tuple, kwargs: dict) -> tuple[dict, Any, Any]:
+            """Bind call arguments, returning (task arguments, state, on_event)."""
+            if takes_no_args and not args and kwargs.keys() <= _CALL_CONTROL_KWARGS:
+                # Nothing to marshal, so skip signature binding entirely
+                return {}, kwargs.get("state"), kwargs.get("on_event")
+
+            # Bind to the new signature that includes the 'state' and 'on_event'
+            # parameters, then pop those since they are handled separately
+            bound_args = new_sig.bind(*args, **kwargs)
+            bound_args.apply_defaults()
+            arguments = bound_args.arguments
+            state = arguments.pop("state", None)
+            on_event = arguments.pop("on_event", None)
+            return arguments, state, on_event
+
+        def build_inputs(arguments: dict) -> Any:
+            """Validate bound arguments and build the inputs dataclass instance."""
+            if not arguments:
+                return None
+            validated_args = {}
+            for name, value in arguments.items():
+                try:
+                    validated_args[name] = validate_with_sampling(
+                        value, param_annotations[name]
+                    )
+                except Exception as e:
+                    raise ValueError(
+                        f"Validation failed for argument '{name}':\n{e}"
+                    ) from e
+            return inputs_dataclass(**validated_args)
+
         # Create a custom callable class with proper __repr__
         class TaskWrapper:
             def __init__(self, task_func, stream_func, agent_name, task_name):
@@ -284,12 +343,18 @@ class TaskMixin(TaskLoopMixin, BaseAgent):
                 self.__signature__ = new_sig
 
                 # Set namespace for dual-decorator pattern
-                namespace = self._agent_name
-                self.__agex_task_namespace__ = namespace
+                meta = _AgexMeta()
+                meta.namespace = self._agent_name
+                self.__agex_meta__ = meta
 
             def __call__(self, *args, **kwargs):
                 return self._task_func(*args, **kwargs)
 
+            @property
+            def __agex_task_namespace__(self):
+                """Deprecated read-only alias for `__agex_meta__.namespace`."""
+                return self.__agex_meta__.namespace
+
             def __repr__(self):
                 return f"<agex.task {self._agent_name}/{self._task_name} at {hex(id(self))}>"
 
@@ -299,30 +364,10 @@ class TaskMixin(TaskLoopMixin, BaseAgent):
 
         # Create the actual task function
         def task_wrapper(*args, **kwargs):
-            # Bind to the new signature that includes the 'state' and 'on_event' parameters
-            bound_args = new_sig.bind(*args, **kwargs)
-            bound_args.apply_defaults()
-
-            # Pop the state and on_event arguments, they are handled separately
-            state = bound_args.arguments.pop("state", None)
-            on_event = bound_args.arguments.pop("on_event", None)
+            arguments, state, on_event = bind_call(args, kwargs)
 
             # Create inputs dataclass instance with pass-by-value semantics
-            inputs_instance = None
-            if bound_args.arguments:
-                validated_args = {}
-                for name, value in bound_args.arguments.items():
-                    annotation = original_sig.parameters[name].annotation
-                    if annotation == inspect.Parameter.empty:
-                        annotation = Any  # Default to Any if no type hint
-                    try:
-                        validated_value = validate_with_sampling(value, annotation)
-                        validated_args[name] = validated_value
-                    except Exception as e:
-                        raise ValueError(
-                            f"Validation failed for argument '{name}':\n{e}"
-                        ) from e
-                inputs_instance = inputs_dataclass(**validated_args)
+            inputs_instance = build_inputs(arguments)
 
             # Call the task loop
             return self._run_task_loop(
@@ -339,29 +384,10 @@ class TaskMixin(TaskLoopMixin, BaseAgent):
         def stream(*args, **kwargs):
             """Stream events in real-time during task execution."""
             # Same parameter processing as regular task execution
-            bound_args = new_sig.bind(*args, **kwargs)
-            bound_args.apply_defaults()
-
-            # Pop the state and on_event arguments, they are handled separately
-            state = bound_args.arguments.pop("state", None)
-            user_on_event = bound_args.arguments.pop("on_event", None)
+            arguments, state, user_on_event = bind_call(args, kwargs)
 
             # Create inputs dataclass instance with pass-by-value semantics
-            inputs_instance = None
-            if bound_args.arguments:
-                validated_args = {}
-                for name, value in bound_args.arguments.items():
-                    annotation = original_sig.parameters[name].annotation
-                    if annotation == inspect.Parameter.empty:
-                        annotation = Any  # Default to Any if no type hint
-                    try:
-                        validated_value = validate_with_sampling(value, annotation)
-                        validated_args[name] = validated_value
-                    except Exception as e:
-                        raise ValueError(
-                            f"Validation failed for argument '{name}':\n{e}"
-                        ) from e
-                inputs_instance = inputs_dataclass(**validated_args)
+            inputs_instance = build_inputs(arguments)
 
             # Implement real-time hierarchical streaming using a worker thread and queue
             from queue import Queue
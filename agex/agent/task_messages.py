@@ -6,10 +6,19 @@ receive, including smart rendering of input parameters and task descriptions.
 """
 
 import inspect
+from functools import lru_cache
 from typing import Any
 
 from agex.render.value import ValueRenderer
 
+# Generous task-appropriate limits for rendering inputs. The renderer holds only
+# these settings, so one instance serves every task message.
+_TASK_INPUT_RENDERER = ValueRenderer(
+    max_len=4096,  # Generous limit for rich task display
+    max_depth=4,  # Deep enough for complex nested objects
+    max_items=50,  # Show more items than default for task context
+)
+
 
 def build_task_message(
     docstring: str | None,
@@ -51,9 +60,26 @@ def build_task_message(
             )
 
     # Add expected output format with clarification for function types
+    try:
+        parts.append(_return_type_instruction(return_type))
+    except TypeError:
+        # Unhashable annotation (e.g. Annotated metadata); format it directly
+        parts.append(_return_type_instruction.__wrapped__(return_type))
+
+    return "\n\n".join(parts)
+
+
+@lru_cache(maxsize=256)
+def _return_type_instruction(return_type: Any) -> str:
+    """
+    Describe how to report a result of the given type.
+
+    Memoized on the type itself, since the same task signature is formatted on
+    every invocation.
+    """
     if return_type is inspect.Parameter.empty:
         # No return type annotation - just call task_success() with no arguments
-        parts.append("When complete, call `task_success()` to indicate completion.")
+        return "When complete, call `task_success()` to indicate completion."
     elif "Callable" in str(return_type):
         # Function return type - special instructions
         # Clean up the type representation to remove confusing module references
@@ -62,7 +88,7 @@ def build_task_message(
         if return_type_str.startswith("typing."):
             return_type_str = return_type_str[7:]  # Remove "typing." prefix
 
-        parts.append(
+        return (
             f"When complete, call `task_success(your_function)` where your_function is the {return_type_str} you created. "
             "Pass the function object itself, not the result of calling the function.\n"
         )
@@ -81,11 +107,7 @@ def build_task_message(
             # use the full string representation to preserve type parameters
             return_type_name = str(return_type)
 
-        parts.append(
-            f"When complete, call `task_success(result)` with your result. The result type should be `{return_type_name}`."
-        )
-
-    return "\n\n".join(parts)
+        return f"When complete, call `task_success(result)` with your result. The result type should be `{return_type_name}`."
 
 
 def _smart_render_for_task_input(value: Any) -> str:
@@ -96,9 +118,4 @@ def _smart_render_for_task_input(value: Any) -> str:
     rich content like DataFrames, arrays, and other complex objects
     in their natural representation when possible.
     """
-    renderer = ValueRenderer(
-        max_len=4096,  # Generous limit for rich task display
-        max_depth=4,  # Deep enough for complex nested objects
-        max_items=50,  # Show more items than default for task context
-    )
-    return renderer.render(value, compact=False)
+    return _TASK_INPUT_RENDERER.render(value, compact=False)
@@ -12,6 +12,14 @@ from .resolver import Resolver
 class BaseEvaluator(ast.NodeVisitor):
     """A base class for evaluators, holding shared state."""
 
+    # Per-class map from AST node type to its unbound visit_* method (or
+    # generic_visit), filled lazily so each node dispatches with one dict hit
+    _visit_dispatch: dict[type, Callable[..., Any]] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._visit_dispatch = {}
+
     def __init__(
         self,
         agent: "BaseAgent",
@@ -72,7 +80,13 @@ class BaseEvaluator(ast.NodeVisitor):
     def visit(self, node: ast.AST) -> Any:
         """Override visit to add timeout checking on every AST node visit."""
         self._check_timeout()
-        return super().visit(node)
+        node_type = node.__class__
+        method = self._visit_dispatch.get(node_type)
+        if method is None:
+            cls = type(self)
+            method = getattr(cls, f"visit_{node_type.__name__}", cls.generic_visit)
+            self._visit_dispatch[node_type] = method
+        return method(self, node)
 
     def add_sub_agent_time(self, duration: float) -> None:
         """Add time spent in sub-agent calls to be deducted from timeout."""
@@ -2,7 +2,7 @@ import ast
 import inspect
 from typing import Any
 
-from ..agent.datatypes import TaskSuccess, _AgentExit
+from ..agent.datatypes import TaskSuccess, _AgentExit, _task_namespace
 from .base import BaseEvaluator
 from .builtins import STATEFUL_BUILTINS, _print_stateful
 from .error import EvalError
@@ -184,7 +184,7 @@ class CallEvaluator(BaseEvaluator):
                 return fn.execute(args, kwargs, self.source_code, parent_evaluator=self)
 
             # If this is a dual-decorated function needing state injection, route via proxy
-            if hasattr(fn, "__agex_task_namespace__"):
+            if _task_namespace(fn) is not None:
                 from .functions import TaskProxy
 
                 proxy = TaskProxy(self, getattr(fn, "fn", fn))
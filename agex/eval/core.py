@@ -1,4 +1,5 @@
 import ast
+from functools import lru_cache
 from typing import Any, Callable
 
 from agex.agent.base import BaseAgent
@@ -74,6 +75,29 @@ class Evaluator(
         self.visit(node.value)
 
 
+@lru_cache(maxsize=256)
+def _parse_cached(program: str) -> ast.Module | SyntaxError:
+    try:
+        return ast.parse(program)
+    except SyntaxError as e:
+        return e
+
+
+def _parse_program(program: str) -> ast.Module:
+    """
+    Parse program source, memoized on the exact source text.
+
+    The evaluator only reads the tree (it never rewrites nodes), so identical
+    programs, such as retried or scripted responses and shared setup code, can
+    safely share one parsed tree. Syntax errors are memoized too; each call
+    raises a fresh copy so tracebacks don't accumulate on a shared instance.
+    """
+    result = _parse_cached(program)
+    if isinstance(result, SyntaxError):
+        raise type(result)(*result.args)
+    return result
+
+
 def evaluate_program(
     program: str,
     agent: BaseAgent,
@@ -95,7 +119,7 @@ def evaluate_program(
     actual_timeout = (
         timeout_seconds if timeout_seconds is not None else agent.timeout_seconds
     )
-    tree = ast.parse(program)
+    tree = _parse_program(program)
     evaluator = Evaluator(
         agent,
         state,
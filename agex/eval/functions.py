@@ -38,7 +38,7 @@ class NativeFunction:
     def __getattr__(self, name: str) -> Any:
         # Preserve important attributes from the wrapped function
         # This is especially important for dual-decorated functions
-        # that have __agex_task_namespace__ attributes
+        # that carry __agex_meta__ records
         if hasattr(self.fn, name):
             return getattr(self.fn, name)
         raise AttributeError(
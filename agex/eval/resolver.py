@@ -11,6 +11,8 @@ from .objects import AgexInstance, AgexModule, AgexObject, BoundInstanceObject
 from .user_errors import AgexAttributeError, AgexNameError
 from .utils import get_allowed_attributes_for_instance
 
+_MISSING = object()
+
 
 class Resolver:
     """
@@ -20,12 +22,17 @@ class Resolver:
     def __init__(self, agent):
         self.agent = agent
         # Policy-backed resolution only
+        # Allowed attribute names per host type. Computing them walks the MRO
+        # and probes the policy for every candidate name, and the policy cannot
+        # change while a program is being evaluated, so cache per resolver.
+        self._allowed_attrs: dict[type, set[str]] = {}
 
     # --- Name Resolution ---
     def resolve_name(self, name: str, state, node) -> Any:
-        # 1. Builtins
-        if name in BUILTINS:
-            return BUILTINS[name]
+        # 1. Builtins (task_success, print, ...) with a single dict probe
+        builtin = BUILTINS.get(name, _MISSING)
+        if builtin is not _MISSING:
+            return builtin
 
         # 2. State
         value = state.get(name)
@@ -185,7 +192,11 @@ class Resolver:
             return getattr(res, "fn", None) or getattr(res, "cls", None) or submod
 
         # Check for registered host classes and whitelisted methods on Python objects
-        allowed_attrs = get_allowed_attributes_for_instance(self.agent, value)
+        value_type = type(value)
+        allowed_attrs = self._allowed_attrs.get(value_type)
+        if allowed_attrs is None:
+            allowed_attrs = get_allowed_attributes_for_instance(self.agent, value)
+            self._allowed_attrs[value_type] = allowed_attrs
         if attr_name in allowed_attrs:
             try:
                 return getattr(value, attr_name)
@@ -8,12 +8,20 @@ good error messages.
 
 import io
 import pickle
+from functools import lru_cache
 from types import ModuleType
 from typing import Any
 
 from .error import EvalError
 from .objects import AgexModule
 
+# Types that are always pickleable and contain no other objects
+_SAFE_ATOMIC_TYPES = frozenset(
+    {int, float, str, bytes, bool, type(None), complex, range}
+)
+# Builtin containers whose contents can be scanned one level deep
+_PLAIN_COLLECTION_TYPES = (list, tuple, set, frozenset)
+
 
 def check_assignment_safety(value: Any) -> Any:
     """
@@ -36,10 +44,21 @@ def check_assignment_safety(value: Any) -> Any:
         return AgexModule(name=value.__name__, agent_fingerprint="")
 
     # Fast path: known-safe atomic types
-    safe_atomic_types = {int, float, str, bytes, bool, type(None), complex, range}
-    if type(value) in safe_atomic_types:
+    value_type = type(value)
+    if value_type in _SAFE_ATOMIC_TYPES:
         return value
 
+    # Fast path: plain builtin collections holding only atomic values
+    if value_type in _PLAIN_COLLECTION_TYPES:
+        if all(type(item) in _SAFE_ATOMIC_TYPES for item in value):
+            return value
+    elif value_type is dict:
+        if all(
+            type(k) in _SAFE_ATOMIC_TYPES and type(v) in _SAFE_ATOMIC_TYPES
+            for k, v in value.items()
+        ):
+            return value
+
     # Explicitly block file objects
     if isinstance(value, io.IOBase):
         raise EvalError(
@@ -102,7 +121,12 @@ def check_assignment_safety(value: Any) -> Any:
 
 def _has_pickle_support(obj: Any) -> bool:
     """Check if object explicitly supports pickling via dunder methods."""
-    obj_type = type(obj)
+    return _type_has_pickle_support(type(obj))
+
+
+@lru_cache(maxsize=512)
+def _type_has_pickle_support(obj_type: type) -> bool:
+    """Cached per-type check for explicitly defined pickle dunders."""
     # Use only the most reliable pickle methods that strongly indicate
     # the object was designed to be pickled
     reliable_pickle_methods = [
@@ -2,6 +2,8 @@
 Shallow, sampling-based validation for large data structures.
 """
 
+import sys
+from itertools import islice
 from typing import Any, get_args, get_origin
 
 from pydantic import ConfigDict, TypeAdapter, ValidationError
@@ -13,21 +15,22 @@ DEFAULT_SAMPLE_SIZE = 10
 # Strict configuration that prevents type coercion to catch type mismatches
 STRICT_CONFIG = ConfigDict(arbitrary_types_allowed=True, strict=True)
 
+# Element types that can be checked with a plain `type(x) is T` test. Strict
+# validation would accept exactly these values unchanged, so a passing check
+# lets us skip building a Pydantic adapter entirely.
+_PRIMITIVE_TYPES = (int, float, str, bool)
+_NO_FAST_PATH = object()
+
 
 def _numpy_peek_serializer(obj: Any) -> list:
     """
     A Pydantic serializer fallback that converts the head of a numpy array
     into a list for 'peek' validation.
     """
-    try:
-        import numpy as np
-
-        if isinstance(obj, np.ndarray):
-            # We just return the head, no need for "..." string which would fail validation
-            return obj[:DEFAULT_SAMPLE_SIZE].tolist()
-    except ImportError:
-        # If numpy is not present, we can't handle it.
-        pass
+    np = sys.modules.get("numpy")
+    if np is not None and isinstance(obj, np.ndarray):
+        # We just return the head, no need for "..." string which would fail validation
+        return obj[:DEFAULT_SAMPLE_SIZE].tolist()
 
     # If it's not a numpy array, or numpy is not installed, we can't handle it.
     # Raising TypeError is the signal to the Pydantic serializer
@@ -50,26 +53,27 @@ def validate_with_sampling(value: Any, annotation: Any) -> Any:
     Raises:
         ValidationError: If validation fails for the object or its samples.
     """
-    # Peek validation for numpy arrays
-    try:
-        import numpy as np
-
-        if isinstance(value, np.ndarray):
-            # For a numpy array, we don't validate the whole array for performance.
-            # Instead, we 'peek' at the first few items to validate their type.
-            item_type = (
-                annotation.item_type if hasattr(annotation, "item_type") else Any
-            )
-            adapter = TypeAdapter(list[item_type])
-            sample = value[:DEFAULT_SAMPLE_SIZE]
-            adapter.validate_python(sample)
-            return value  # Return the original, un-truncated array
-    except ImportError:
-        # If numpy is not installed, we just skip this special handling.
-        pass
+    # Peek validation for numpy arrays. An ndarray can only exist if numpy has
+    # already been imported, so consult sys.modules rather than importing it
+    # (which would pull numpy into every validation's cold start).
+    np = sys.modules.get("numpy")
+    if np is not None and isinstance(value, np.ndarray):
+        # For a numpy array, we don't validate the whole array for performance.
+        # Instead, we 'peek' at the first few items to validate their type.
+        item_type = annotation.item_type if hasattr(annotation, "item_type") else Any
+        adapter = TypeAdapter(list[item_type])
+        sample = value[:DEFAULT_SAMPLE_SIZE]
+        adapter.validate_python(sample)
+        return value  # Return the original, un-truncated array
 
     origin_type = get_origin(annotation)
 
+    # Fast path for homogeneous primitive collections (e.g. list[int])
+    if origin_type is list or origin_type is dict:
+        fast_result = _validate_primitive_fast(value, origin_type, annotation)
+        if fast_result is not _NO_FAST_PATH:
+            return fast_result
+
     # For lists and tuples, apply sampling if they exceed the threshold
     if origin_type in (list, tuple) and isinstance(value, (list, tuple)):
         if len(value) > DEFAULT_SAMPLING_THRESHOLD:
@@ -94,6 +98,48 @@ def validate_with_sampling(value: Any, annotation: Any) -> Any:
         raise
 
 
+def _validate_primitive_fast(value: Any, origin_type: Any, annotation: Any) -> Any:
+    """
+    Validates `list[T]` / `dict[K, V]` of primitive types with exact type checks.
+
+    Collections above the sampling threshold only have their head and tail
+    checked, mirroring the Pydantic sampling path. Returns a shallow copy on
+    success, or `_NO_FAST_PATH` so the caller falls back to Pydantic (which
+    produces the rich error message).
+    """
+    args = get_args(annotation)
+
+    # Exact type checks: subclasses take the Pydantic path
+    if origin_type is list and type(value) is list:  # noqa: E721
+        if len(args) != 1 or args[0] not in _PRIMITIVE_TYPES:
+            return _NO_FAST_PATH
+        item_type = args[0]
+        if len(value) > DEFAULT_SAMPLING_THRESHOLD:
+            sample = value[:DEFAULT_SAMPLE_SIZE] + value[-DEFAULT_SAMPLE_SIZE:]
+        else:
+            sample = value
+        if all(type(x) is item_type for x in sample):
+            return list(value)
+
+    elif origin_type is dict and type(value) is dict:  # noqa: E721
+        if (
+            len(args) != 2
+            or args[0] not in _PRIMITIVE_TYPES
+            or args[1] not in _PRIMITIVE_TYPES
+        ):
+            return _NO_FAST_PATH
+        key_type, value_type = args
+        if len(value) > DEFAULT_SAMPLING_THRESHOLD:
+            items = list(islice(value.items(), DEFAULT_SAMPLE_SIZE))
+            items += islice(reversed(value.items()), DEFAULT_SAMPLE_SIZE)
+        else:
+            items = value.items()
+        if all(type(k) is key_type and type(v) is value_type for k, v in items):
+            return dict(value)
+
+    return _NO_FAST_PATH
+
+
 def _validate_sequence_sample(sequence: list | tuple, annotation: Any) -> list | tuple:
     """
     Validates a sample of a large sequence (list or tuple).
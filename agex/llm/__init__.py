@@ -1,33 +1,57 @@
-from typing import Any, Literal
+import importlib
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Any, Literal
 
+from .cached_client import CachedLLMClient
 from .config import get_llm_config
 from .core import LLMClient, LLMResponse
 from .dummy_client import DummyLLMClient
 
-# Optional imports for LLM providers
-try:
-    from .openai_client import OpenAIClient
-except ImportError:
-    OpenAIClient = None
+if TYPE_CHECKING:
+    from .anthropic_client import AnthropicClient as AnthropicClient
+    from .gemini_client import GeminiClient as GeminiClient
+    from .openai_client import OpenAIClient as OpenAIClient
 
-try:
-    from .anthropic_client import AnthropicClient
-except ImportError:
-    AnthropicClient = None
+# Optional LLM provider clients, imported on first use. The provider SDKs are
+# heavy (seconds of import time combined), so `import agex` shouldn't pay for
+# them until a client is actually requested.
+_PROVIDER_CLIENTS = {
+    "OpenAIClient": (".openai_client", "openai"),
+    "AnthropicClient": (".anthropic_client", "anthropic"),
+    "GeminiClient": (".gemini_client", "google.generativeai"),
+}
+
+
+def _load_client(name: str) -> Any:
+    """Return the named provider client class, or None if its SDK is missing."""
+    if name not in globals():
+        module_name, _ = _PROVIDER_CLIENTS[name]
+        try:
+            module = importlib.import_module(module_name, __name__)
+            globals()[name] = getattr(module, name)
+        except ImportError:
+            globals()[name] = None
+    return globals()[name]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _PROVIDER_CLIENTS:
+        return _load_client(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _sdk_installed(package: str) -> bool:
+    try:
+        return find_spec(package) is not None
+    except ModuleNotFoundError:
+        return False
 
-try:
-    from .gemini_client import GeminiClient
-except ImportError:
-    GeminiClient = None
 
 # Build __all__ dynamically based on available clients
-__all__ = ["DummyLLMClient", "connect_llm", "LLMResponse"]
-if OpenAIClient is not None:
-    __all__.append("OpenAIClient")
-if AnthropicClient is not None:
-    __all__.append("AnthropicClient")
-if GeminiClient is not None:
-    __all__.append("GeminiClient")
+__all__ = ["CachedLLMClient", "DummyLLMClient", "connect_llm", "LLMResponse"]
+__all__ += [
+    name for name, (_, package) in _PROVIDER_CLIENTS.items() if _sdk_installed(package)
+]
 
 
 def connect_llm(
@@ -51,6 +75,7 @@ def connect_llm(
         return DummyLLMClient(**kwargs)
 
     if final_provider == "anthropic":
+        AnthropicClient = _load_client("AnthropicClient")
         if AnthropicClient is None:
             raise ImportError(
                 "Anthropic provider requires the 'anthropic' package. "
@@ -59,6 +84,7 @@ def connect_llm(
         return AnthropicClient(**config)
 
     if final_provider == "gemini":
+        GeminiClient = _load_client("GeminiClient")
         if GeminiClient is None:
             raise ImportError(
                 "Gemini provider requires the 'google-generativeai' package. "
@@ -67,6 +93,7 @@ def connect_llm(
         return GeminiClient(**config)
 
     if final_provider == "openai":
+        OpenAIClient = _load_client("OpenAIClient")
         if OpenAIClient is None:
             raise ImportError(
                 "OpenAI provider requires the 'openai' package. "
@@ -76,11 +103,11 @@ def connect_llm(
 
     # Build list of available providers for the error message
     available_providers = ["dummy"]
-    if OpenAIClient is not None:
+    if _load_client("OpenAIClient") is not None:
         available_providers.append("openai")
-    if AnthropicClient is not None:
+    if _load_client("AnthropicClient") is not None:
         available_providers.append("anthropic")
-    if GeminiClient is not None:
+    if _load_client("GeminiClient") is not None:
         available_providers.append("gemini")
 
     raise ValueError(
@@ -15,6 +15,26 @@ from agex.llm.core import (
 # Define keys for client setup vs. completion
 CLIENT_CONFIG_KEYS = {"api_key", "timeout"}
 
+# The structured response tool, identical on every request
+STRUCTURED_RESPONSE_TOOL = {
+    "name": "structured_response",
+    "description": "Respond with thinking and code in a structured format",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "thinking": {
+                "type": "string",
+                "description": "Your natural language thinking about the task",
+            },
+            "code": {
+                "type": "string",
+                "description": "The Python code to execute",
+            },
+        },
+        "required": ["thinking", "code"],
+    },
+}
+
 
 def _format_content(message: Message) -> List[dict]:
     """Format a Message object's content into the list structure Anthropic expects."""
@@ -84,26 +104,6 @@ class AnthropicClient(LLMClient):
                     {"role": msg.role, "content": _format_content(msg)}
                 )
 
-        # Define the structured response tool
-        structured_response_tool = {
-            "name": "structured_response",
-            "description": "Respond with thinking and code in a structured format",
-            "input_schema": {
-                "type": "object",
-                "properties": {
-                    "thinking": {
-                        "type": "string",
-                        "description": "Your natural language thinking about the task",
-                    },
-                    "code": {
-                        "type": "string",
-                        "description": "The Python code to execute",
-                    },
-                },
-                "required": ["thinking", "code"],
-            },
-        }
-
         try:
             # Set default max_tokens if not provided
             if "max_tokens" not in request_kwargs:
@@ -114,12 +114,21 @@ class AnthropicClient(LLMClient):
             api_kwargs = {
                 "model": self._model,
                 "messages": conversation_messages,
-                "tools": [structured_response_tool],
+                "tools": [STRUCTURED_RESPONSE_TOOL],
                 "tool_choice": {"type": "tool", "name": "structured_response"},
                 **request_kwargs,
             }
             if system_message is not None:
-                api_kwargs["system"] = system_message
+                # The system message (primer plus registered resources) is the
+                # stable prefix of every turn, so mark it for prompt caching and
+                # let later turns read it from cache instead of re-processing it
+                api_kwargs["system"] = [
+                    {
+                        "type": "text",
+                        "text": system_message,
+                        "cache_control": {"type": "ephemeral"},
+                    }
+                ]
 
             response = self.client.messages.create(**api_kwargs)
 
@@ -0,0 +1,93 @@
+"""
+Response-caching wrapper for LLM clients.
+
+This module provides an LLMClient that replays stored responses for requests it
+has already seen, useful for re-running deterministic agent workflows (CI, test
+suites, notebooks) without repeating provider calls.
+"""
+
+import hashlib
+import json
+from typing import Any, List
+
+from agex.state.kv import KVStore, Memory
+
+from .core import LLMClient, LLMResponse, Message, MultimodalMessage
+
+
+def _message_payload(message: Message) -> list:
+    """Reduce a message to JSON-serializable data for cache keys."""
+    if isinstance(message, MultimodalMessage):
+        parts = [
+            [part.type, part.text if part.type == "text" else part.image]  # type: ignore[union-attr]
+            for part in message.content
+        ]
+        return [message.role, parts]
+    return [message.role, message.content]
+
+
+class CachedLLMClient(LLMClient):
+    """
+    Wraps another LLMClient and caches its responses by request content.
+
+    The cache key covers the provider, model, completion kwargs (including the
+    settings the wrapped client was constructed with), and the full message
+    list, so any change to the conversation (or the agent's system message) is
+    a miss. Requests sampled at a non-zero temperature bypass the cache, and
+    failed completions are never cached.
+    """
+
+    def __init__(self, client: LLMClient, store: KVStore | None = None):
+        """
+        Args:
+            client: The client that serves cache misses.
+            store: Where responses are kept. Defaults to an in-memory store; pass
+                   a kv.Disk to reuse responses across processes.
+        """
+        self.client = client
+        self.store = store if store is not None else Memory()
+
+    def _cache_key(self, messages: List[Message], kwargs: dict[str, Any]) -> str:
+        payload = {
+            "provider": self.client.provider_name,
+            "model": self.client.model,
+            "kwargs": kwargs,
+            "messages": [_message_payload(m) for m in messages],
+        }
+        try:
+            json_str = json.dumps(
+                payload,
+                sort_keys=True,
+                separators=(",", ":"),
+                check_circular=False,
+            )
+        except TypeError as e:
+            raise TypeError(
+                f"CachedLLMClient requires JSON-serializable completion kwargs: {e}"
+            ) from e
+        return "llm:" + hashlib.sha256(json_str.encode("utf-8")).hexdigest()
+
+    def complete(self, messages: List[Message], **kwargs) -> LLMResponse:
+        """Return the cached response for these messages, or complete and store."""
+        # Settings given at construction apply to every call, so they belong in
+        # the key alongside the per-call kwargs.
+        request_kwargs = {**getattr(self.client, "_kwargs", {}), **kwargs}
+        if request_kwargs.get("temperature"):
+            # Sampled responses aren't reproducible; never replay or store them
+            return self.client.complete(messages, **kwargs)
+
+        key = self._cache_key(messages, request_kwargs)
+        if (cached := self.store.get(key)) is not None:
+            return LLMResponse.model_validate_json(cached)
+
+        response = self.client.complete(messages, **kwargs)
+        self.store.set(key, response.model_dump_json().encode("utf-8"))
+        return response
+
+    @property
+    def model(self) -> str:
+        return self.client.model
+
+    @property
+    def provider_name(self) -> str:
+        return self.client.provider_name
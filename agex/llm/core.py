@@ -5,19 +5,19 @@ from typing import List, Literal, Union
 from pydantic import BaseModel
 
 
-@dataclass
+@dataclass(slots=True)
 class TextMessage:
     role: Literal["user", "assistant", "system"]
     content: str
 
 
-@dataclass
+@dataclass(slots=True)
 class TextPart:
     text: str
     type: Literal["text"] = "text"
 
 
-@dataclass
+@dataclass(slots=True)
 class ImagePart:
     """Represents a base64 encoded image."""
 
@@ -28,7 +28,7 @@ class ImagePart:
 ContentPart = Union[TextPart, ImagePart]
 
 
-@dataclass
+@dataclass(slots=True)
 class MultimodalMessage:
     role: Literal["user", "assistant", "system"]
     content: List[ContentPart]
@@ -5,36 +5,42 @@ This module provides a mock LLMClient that returns predefined LLMResponse object
 sequentially, useful for testing agent behavior without actual LLM calls.
 """
 
-from typing import List
+from typing import List, Sequence
 
 from .core import LLMClient, LLMResponse, Message, MultimodalMessage
 
+# Shared by every client constructed without explicit responses. Safe to share
+# because `complete` hands out copies rather than the stored objects.
+_DEFAULT_RESPONSES: tuple[LLMResponse, ...] = (
+    LLMResponse(
+        thinking="I will use the provided tools.",
+        code="print('Hello from Dummy')",
+    ),
+)
+
 
 class DummyLLMClient(LLMClient):
     """
     A dummy LLM client that returns predefined LLMResponse objects in sequence.
     Useful for testing agent logic without actual LLM calls.
+
+    Responses are served by an index cursor (`call_count`) rather than by
+    popping from the list, so each call is O(1) and the sequence cycles once
+    exhausted instead of raising. The sequence is frozen into a tuple at
+    construction, and clients without explicit responses share one default.
     """
 
     def __init__(
-        self, responses: List[LLMResponse | Exception] | None = None, **kwargs
+        self, responses: Sequence[LLMResponse | Exception] | None = None, **kwargs
     ):
         """
         Initialize with a sequence of LLMResponse objects to return.
 
         Args:
-            responses: A list of LLMResponse objects to cycle through. If None, a default
+            responses: A sequence of LLMResponse objects to cycle through. If None, a default
                        response is used.
         """
-        if responses:
-            self.responses = responses
-        else:
-            self.responses = [
-                LLMResponse(
-                    thinking="I will use the provided tools.",
-                    code="print('Hello from Dummy')",
-                )
-            ]
+        self.responses = tuple(responses) if responses else _DEFAULT_RESPONSES
         self.call_count = 0
         self.all_messages: list[list[Message]] = []
 
@@ -20,6 +20,7 @@ from ..agent.datatypes import (
     RegisteredModule,
     RegisteredObject,
     Visibility,
+    _task_namespace,
 )
 
 
@@ -37,7 +38,7 @@ def _is_sub_agent_function(fn: Any) -> bool:
         # The wrapper preserves the original function's docstring or sets it to "User-defined function"
         # We need to check if the underlying function is a TaskUserFunction
         # Look for the dual-decorator attributes that indicate a task function
-        if hasattr(fn, "__agex_task_namespace__"):
+        if _task_namespace(fn) is not None:
             return True
 
     return False
@@ -1,29 +1,40 @@
 import base64
+import importlib
 import io
+from types import ModuleType
 from typing import Any, List, Optional
 
-# Gracefully import optional image libraries
-try:
-    from PIL import Image
-except ImportError:
-    Image = None  # type: ignore
-
-try:
-    import matplotlib.figure
-except ImportError:
-    matplotlib = None  # type: ignore
-
-try:
-    import plotly.graph_objects
-except ImportError:
-    plotly = None  # type: ignore
-
-
 from ..eval.objects import ImageAction, PrintAction
 from ..llm.core import ContentPart, ImagePart, TextPart
 from ..tokenizers import Tokenizer, get_tokenizer
 from .value import ValueRenderer
 
+# Top-level package of each supported image library -> module holding its type
+_IMAGE_MODULES = {
+    "PIL": "PIL.Image",
+    "matplotlib": "matplotlib.figure",
+    "plotly": "plotly.graph_objects",
+}
+
+
+def _image_module(image: Any) -> Optional[ModuleType]:
+    """
+    Returns the image library module matching the value's type, if any.
+
+    Only the library whose top-level package defines the value's class (or one
+    of its bases) is resolved, so plain values never touch PIL, matplotlib or
+    plotly, and those libraries are never loaded on behalf of agents that
+    don't produce images.
+    """
+    for cls in type(image).__mro__:
+        name = _IMAGE_MODULES.get(cls.__module__.partition(".")[0])
+        if name is not None:
+            try:
+                return importlib.import_module(name)
+            except ImportError:
+                return None
+    return None
+
 
 def _estimate_image_cost(image: Any, detail: str = "high") -> int:
     """
@@ -43,16 +54,19 @@ def _estimate_image_cost(image: Any, detail: str = "high") -> int:
 
     # For high detail, we need the image dimensions.
     width, height = 0, 0
-    if Image and isinstance(image, Image.Image):
+    module = _image_module(image)
+    if module is None:
+        return 2000
+    if module.__name__ == "PIL.Image" and isinstance(image, module.Image):
         width, height = image.size
-    elif matplotlib and isinstance(image, matplotlib.figure.Figure):
+    elif module.__name__ == "matplotlib.figure" and isinstance(image, module.Figure):
         # Matplotlib figures are in inches; convert to pixels using a common default DPI.
         dpi = image.get_dpi() if image.get_dpi() else 100.0
         width, height = (
             int(image.get_figwidth() * dpi),
             int(image.get_figheight() * dpi),
         )
-    elif plotly and isinstance(image, plotly.graph_objects.Figure):
+    elif module.__name__ == "plotly.graph_objects" and isinstance(image, module.Figure):
         # Plotly figures often have explicit pixel dimensions.
         width = image.layout.width if image.layout.width else 500
         height = image.layout.height if image.layout.height else 400
@@ -71,15 +85,22 @@ def _estimate_image_cost(image: Any, detail: str = "high") -> int:
 def _serialize_image_to_base64(image: Any) -> Optional[str]:
     """Serializes a supported image type to a PNG base64 string."""
     buffer = io.BytesIO()
+    module = _image_module(image)
+    if module is None:
+        return None
     try:
-        if Image and isinstance(image, Image.Image):
+        if module.__name__ == "PIL.Image" and isinstance(image, module.Image):
             # For security and consistency, convert to a standard format like PNG.
             image.save(buffer, format="PNG")
             return base64.b64encode(buffer.getvalue()).decode("utf-8")
-        elif matplotlib and isinstance(image, matplotlib.figure.Figure):
+        elif module.__name__ == "matplotlib.figure" and isinstance(
+            image, module.Figure
+        ):
             image.savefig(buffer, format="png", bbox_inches="tight")
             return base64.b64encode(buffer.getvalue()).decode("utf-8")
-        elif plotly and isinstance(image, plotly.graph_objects.Figure):
+        elif module.__name__ == "plotly.graph_objects" and isinstance(
+            image, module.Figure
+        ):
             # kaleido is used by plotly to export static images
             image_bytes = image.to_image(format="png")
             return base64.b64encode(image_bytes).decode("utf-8")
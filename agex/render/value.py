@@ -1,9 +1,20 @@
+import re
 from dataclasses import fields, is_dataclass
 from typing import Any
 
 from ..eval.functions import UserFunction
 from ..eval.objects import AgexClass, AgexInstance, AgexObject, PrintAction
 
+# Numeric patterns that suggest data rows in a table-like repr
+_DATA_LINE_RE = re.compile(r"^\s*\d+\s+.*\d+")
+
+# List-like reprs: [...], array([...]), {...}
+_LIST_LIKE_RES = (
+    re.compile(r"^\s*\[.*\]\s*$", re.DOTALL),  # [item1, item2, ...]
+    re.compile(r"^\s*array\(\[.*\]\)\s*$", re.DOTALL),  # array([...])
+    re.compile(r"^\s*{\s*.*\s*}\s*$", re.DOTALL),  # {item1, item2, ...}
+)
+
 
 class ValueRenderer:
     """Renders any Python value into a string suitable for an LLM prompt."""
@@ -204,8 +215,6 @@ class ValueRenderer:
 
     def _is_default_object_repr(self, str_repr: str, type_name: str) -> bool:
         """Check if string representation is the default object repr."""
-        import re
-
         # Pattern: <ClassName object at 0x...> or similar
         default_patterns = [
             rf"<{re.escape(type_name.lower())}.*at 0x",
@@ -268,29 +277,14 @@ class ValueRenderer:
             return True
 
         # Check for numeric patterns that suggest data rows
-        import re
-
-        data_line_pattern = re.compile(r"^\s*\d+\s+.*\d+")
         data_lines = [
-            line for line in non_empty_lines[1:6] if data_line_pattern.match(line)
+            line for line in non_empty_lines[1:6] if _DATA_LINE_RE.match(line)
         ]
         return len(data_lines) >= 2
 
     def _looks_like_list(self, str_repr: str) -> bool:
         """Detect if content looks like a list or array."""
-        import re
-
-        # Look for list-like patterns: [...], array([...]), etc.
-        list_patterns = [
-            r"^\s*\[.*\]\s*$",  # [item1, item2, ...]
-            r"^\s*array\(\[.*\]\)\s*$",  # array([...])
-            r"^\s*{\s*.*\s*}\s*$",  # {item1, item2, ...}
-        ]
-
-        for pattern in list_patterns:
-            if re.match(pattern, str_repr, re.DOTALL):
-                return True
-        return False
+        return any(pattern.match(str_repr) for pattern in _LIST_LIKE_RES)
 
     def _truncate_table(self, lines: list[str]) -> str:
         """Truncate table-like content, preserving headers and some data."""
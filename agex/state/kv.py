@@ -49,6 +49,9 @@ class Memory(KVStore):
     def __init__(self):
         self.memory: dict[str, bytes] = {}
 
+    def clear(self) -> None:
+        self.memory.clear()
+
     def get(self, key: str) -> bytes | None:
         return self.memory.get(key)
 
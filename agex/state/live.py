@@ -2,6 +2,8 @@ from typing import Any, Iterable
 
 from agex.state.core import State
 
+_MISSING = object()
+
 
 class Live(State):
     """
@@ -23,10 +25,7 @@ class Live(State):
         self.store[key] = value
 
     def remove(self, key: str) -> bool:
-        if key in self.store:
-            del self.store[key]
-            return True
-        return False
+        return self.store.pop(key, _MISSING) is not _MISSING
 
     def keys(self) -> Iterable[str]:
         return self.store.keys()
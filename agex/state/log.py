@@ -9,6 +9,7 @@ from typing import Callable
 
 from agex.agent.events import BaseEvent, Event
 from agex.state.core import State
+from agex.state.namespaced import Namespaced
 from agex.state.versioned import Versioned
 
 
@@ -22,8 +23,6 @@ def add_event_to_log(
         event.commit_hash = root_state.current_commit
 
     # Set the full_namespace based on the state context
-    from agex.state.namespaced import Namespaced
-
     if isinstance(state, Namespaced):
         # Use the full namespace path from the Namespaced state
         event.full_namespace = state.namespace
@@ -1,3 +1,5 @@
+import sys
+from functools import lru_cache
 from typing import Any, Iterable
 
 from .core import State
@@ -5,6 +7,18 @@ from .live import Live
 from .versioned import Versioned
 
 
+@lru_cache(maxsize=1024)
+def _namespace_paths(parent: str | None, namespace: str) -> tuple[str, str]:
+    """
+    Return the interned (full path, key prefix) pair for a namespace.
+
+    A Namespaced wrapper is built per task invocation, so the same paths recur
+    constantly; caching them turns the per-call string building into a lookup.
+    """
+    path = namespace if parent is None else f"{parent}/{namespace}"
+    return sys.intern(path), sys.intern(f"{path}/")
+
+
 class Namespaced(State):
     def __init__(self, state: "Versioned | Namespaced | Live", namespace: str):
         if "/" in namespace:
@@ -20,20 +34,21 @@ class Namespaced(State):
 
         self.state = state
 
-        # Build the full namespace path
-        if isinstance(state, Namespaced):
-            # Wrapping another Namespaced - extend its path
-            self.namespace = f"{state.namespace}/{namespace}"
-        else:
-            # Wrapping Versioned or Live (root level)
-            self.namespace = namespace
+        # Build the full namespace path (extending it when wrapping another
+        # Namespaced) along with the precomputed key prefix, so hot-path
+        # accesses are a single concat
+        parent = state.namespace if isinstance(state, Namespaced) else None
+        self.namespace, self._prefix = _namespace_paths(parent, namespace)
+        # Resolve the root store once instead of walking the wrapper chain
+        # on every access (the chain never changes after construction)
+        self._base_store = state.base_store
 
     @property
     def base_store(self) -> "State":
-        return self.state.base_store
+        return self._base_store
 
     def _local_namespace(self, key: str) -> str | None:
-        prefix = f"{self.namespace}/"
+        prefix = self._prefix
         if key.startswith(prefix):
             remainder = key[len(prefix) :]
             # Only return if there are no more slashes (direct child, not nested namespace)
@@ -42,13 +57,13 @@ class Namespaced(State):
         return None
 
     def get(self, key: str, default: Any = None) -> Any:
-        return self.base_store.get(f"{self.namespace}/{key}", default)
+        return self._base_store.get(self._prefix + key, default)
 
     def set(self, key: str, value: Any) -> None:
-        return self.base_store.set(f"{self.namespace}/{key}", value)
+        return self._base_store.set(self._prefix + key, value)
 
     def remove(self, key: str) -> bool:
-        return self.base_store.remove(f"{self.namespace}/{key}")
+        return self._base_store.remove(self._prefix + key)
 
     def keys(self) -> Iterable[str]:
         return (
@@ -59,7 +74,7 @@ class Namespaced(State):
 
     def descendant_keys(self) -> Iterable[str]:
         """Get all keys from this namespace and child namespaces (hierarchical traversal)."""
-        prefix = f"{self.namespace}/"
+        prefix = self._prefix
         return (
             k[len(prefix) :] for k in self.base_store.keys() if k.startswith(prefix)
         )
@@ -71,4 +86,4 @@ class Namespaced(State):
         return ((k, self.get(k)) for k in self.keys())
 
     def __contains__(self, key: str) -> bool:
-        return f"{self.namespace}/{key}" in self.base_store
+        return self._prefix + key in self._base_store
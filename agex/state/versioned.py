@@ -14,6 +14,11 @@ from .live import Live
 PARENT_COMMIT = "__parent_commit__%s"
 COMMIT_KEYSET = "__commit_keyset__%s"
 
+# Same protocol existing stores were written with. Mutation detection compares
+# a fresh dump against the stored bytes, so a different protocol would flag
+# (and rewrite) every object read from an older store.
+PICKLE_PROTOCOL = pickle.DEFAULT_PROTOCOL
+
 
 @dataclass
 class SnapshotResult:
@@ -25,9 +30,14 @@ def _get_commit_hash() -> str:
     return secrets.token_hex(8)
 
 
-def _fast_hash(data: bytes) -> str:
-    """Compute fast hash of bytes data."""
-    return xxhash.xxh64(data).hexdigest()
+def _dumps(value: Any) -> bytes:
+    """Serialize a value for the long-term store."""
+    return pickle.dumps(value, protocol=PICKLE_PROTOCOL)
+
+
+def _fast_hash(data: bytes) -> int:
+    """Compute fast hash of bytes data (XXH3, compared as an int digest)."""
+    return xxhash.xxh3_64_intdigest(data)
 
 
 class Versioned(State):
@@ -38,33 +48,26 @@ class Versioned(State):
         self.removed = set()
         self.long_term = store
 
-        # If no commit hash provided, generate an initial commit hash (like Git's empty state)
-        if commit_hash is None:
-            commit_hash = _get_commit_hash()
-            # Store the initial empty commit metadata so it can be checked out
-            initial_metadata = {
-                COMMIT_KEYSET % commit_hash: pickle.dumps({}),
-                PARENT_COMMIT % commit_hash: pickle.dumps(None),
-            }
-            store.set_many(**initial_metadata)
-
-        self.current_commit = commit_hash
-
         # Track accessed objects for mutation detection
         # key -> (original_hash, object_reference)
-        self.accessed_objects: dict[str, tuple[str, Any]] = {}
+        self.accessed_objects: dict[str, tuple[int, Any]] = {}
+
+        self.commit_keys: dict[str, str] = {}
 
-        self.commit_keys: dict[str, str]
-        if self.current_commit is not None:
-            commit_keyset_bytes = self.long_term.get(
-                COMMIT_KEYSET % self.current_commit
-            )
+        # If no commit hash provided, generate an initial commit hash (like Git's
+        # empty state). Its metadata is written alongside the first real commit
+        # rather than up front, so a state that never snapshots any changes
+        # costs no store writes. Until then it checks out as empty either way.
+        self._pending_root: str | None = None
+        if commit_hash is None:
+            commit_hash = _get_commit_hash()
+            self._pending_root = commit_hash
+        else:
+            commit_keyset_bytes = self.long_term.get(COMMIT_KEYSET % commit_hash)
             if commit_keyset_bytes is not None:
                 self.commit_keys = pickle.loads(commit_keyset_bytes)
-            else:
-                self.commit_keys = {}
-        else:
-            self.commit_keys = {}
+
+        self.current_commit = commit_hash
 
     @property
     def base_store(self) -> "State":
@@ -83,6 +86,12 @@ class Versioned(State):
             key not in self.removed
             and (versioned_key := self.commit_keys.get(key)) is not None
         ):
+            # Objects already loaded since the last snapshot are returned as-is,
+            # so repeated reads neither re-deserialize nor re-hash, and any
+            # mutation made through either reference is detected at snapshot.
+            if (tracked := self.accessed_objects.get(key)) is not None:
+                return tracked[1]
+
             # Get serialized bytes from KV store
             serialized_bytes = self.long_term.get(versioned_key)
             if serialized_bytes is not None:
@@ -92,10 +101,8 @@ class Versioned(State):
                 # Deserialize the object
                 value = pickle.loads(serialized_bytes)
 
-                # Track objects for mutation detection only if not already tracked
-                # This preserves the original object reference that may have been mutated
-                if key not in self.accessed_objects:
-                    self.accessed_objects[key] = (original_hash, value)
+                # Track objects for mutation detection
+                self.accessed_objects[key] = (original_hash, value)
 
                 return value
 
@@ -117,7 +124,11 @@ class Versioned(State):
         return False
 
     def keys(self) -> Iterable[str]:
-        return set(self.live.keys()) | set(self.commit_keys.keys()) - self.removed
+        # Set ops on the dict views directly build one result set rather than
+        # copying both key sets first
+        keys = self.commit_keys.keys() - self.removed
+        keys.update(self.live.keys())
+        return keys
 
     def values(self) -> Iterable[Any]:
         for key in self.keys():
@@ -154,11 +165,11 @@ class Versioned(State):
         mutations = {}
         unsavable_keys = []
 
-        for key, (original_hash, obj_ref) in list(self.accessed_objects.items()):
+        for key, (original_hash, obj_ref) in self.accessed_objects.items():
             # Check ALL accessed objects for mutations, not just unset ones
             # Serialize the object reference we stored
             try:
-                current_bytes = pickle.dumps(obj_ref)
+                current_bytes = _dumps(obj_ref)
                 current_hash = _fast_hash(current_bytes)
             except Exception:
                 # This object was mutated into an unserializable state.
@@ -192,21 +203,22 @@ class Versioned(State):
 
         new_hash = _get_commit_hash()
         diffs = {}
-        new_commit_keys = {}
 
         # Store the order of changes for later diffing.
         diff_keys = tuple(k for k in self.live.keys() if not k.startswith("__"))
         self.live.set("__diff_keys__", diff_keys)
 
-        # carry over existing keys that were not removed
-        for key, value in self.commit_keys.items():
-            if key in self.removed:
-                continue
-            new_commit_keys[key] = value
+        # carry over existing keys that were not removed (a C-level dict copy,
+        # then drop only the removed keys rather than re-inserting every key)
+        new_commit_keys = self.commit_keys.copy()
+        for key in self.removed:
+            new_commit_keys.pop(key, None)
 
-        # layer recent writes on top of existing keys
+        # layer recent writes on top of existing keys (all buffered writes since
+        # the last snapshot land in one set_many below, under one commit)
+        commit_prefix = f"{new_hash}:"
         for key, value in self.live.items():
-            versioned_key = self._versioned_key(key, new_hash)
+            versioned_key = commit_prefix + key
             # Check if we already have serialized bytes from mutation detection
             serialized_value = None
             if key in mutations:
@@ -214,7 +226,7 @@ class Versioned(State):
             else:
                 # Serialize the value to bytes before storing
                 try:
-                    serialized_value = pickle.dumps(value)
+                    serialized_value = _dumps(value)
                 except Exception:
                     unsaved_keys.append(key)
                     continue
@@ -224,8 +236,13 @@ class Versioned(State):
                 new_commit_keys[key] = versioned_key
 
         # Serialize commit metadata
-        diffs[COMMIT_KEYSET % new_hash] = pickle.dumps(new_commit_keys)
-        diffs[PARENT_COMMIT % new_hash] = pickle.dumps(self.current_commit)
+        diffs[COMMIT_KEYSET % new_hash] = _dumps(new_commit_keys)
+        diffs[PARENT_COMMIT % new_hash] = _dumps(self.current_commit)
+        if (root := self._pending_root) is not None:
+            # Store the initial empty commit metadata so it can be checked out
+            diffs[COMMIT_KEYSET % root] = _dumps({})
+            diffs[PARENT_COMMIT % root] = _dumps(None)
+            self._pending_root = None
 
         self.long_term.set_many(**diffs)
         self.commit_keys = new_commit_keys
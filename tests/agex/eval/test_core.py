@@ -1,3 +1,5 @@
+import pytest
+
 from agex import events
 from agex.agent import Agent
 from agex.agent.events import OutputEvent
@@ -40,3 +42,33 @@ def test_stateful_print_builtin():
         [True, None],
         [[10, 20]],
     ]
+
+
+def test_identical_programs_share_parsed_tree():
+    """Re-running the same source reuses one AST without leaking state."""
+    from agex.eval.core import _parse_program
+
+    program = "def double(n):\n    return n * 2\ny = double(3)"
+    assert _parse_program(program) is _parse_program(program)
+
+    first = eval_and_get_state(program)
+    second = eval_and_get_state(program)
+    assert first.get("y") == 6
+    assert second.get("y") == 6
+
+
+def test_syntax_errors_are_memoized_but_raised_fresh():
+    """A bad program is parsed once; each call still raises its own error."""
+    from agex.eval.core import _parse_cached, _parse_program
+
+    program = "x = (1,\ny = 2 +"
+    with pytest.raises(SyntaxError) as first:
+        _parse_program(program)
+    hits = _parse_cached.cache_info().hits
+    with pytest.raises(SyntaxError) as second:
+        _parse_program(program)
+
+    assert _parse_cached.cache_info().hits == hits + 1
+    assert first.value is not second.value
+    assert second.value.msg == first.value.msg
+    assert second.value.lineno == first.value.lineno
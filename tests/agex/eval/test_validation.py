@@ -0,0 +1,41 @@
+"""Tests for shallow, sampling-based validation."""
+
+import pytest
+from pydantic import ValidationError
+
+from agex.eval.validation import validate_with_sampling
+
+
+def test_primitive_list_fast_path_returns_copy():
+    """Homogeneous primitive lists validate without aliasing the input."""
+    items = list(range(2000))
+    result = validate_with_sampling(items, list[int])
+
+    assert result == items
+    assert result is not items
+
+
+def test_primitive_list_fast_path_falls_back_on_mismatch():
+    """A mismatched element still produces Pydantic's rich error."""
+    items = list(range(2000))
+    items[-5] = "not a number"  # type: ignore
+
+    with pytest.raises(ValidationError, match="Input should be a valid integer"):
+        validate_with_sampling(items, list[int])
+
+
+def test_primitive_list_fast_path_is_strict_about_bool():
+    """bool is not accepted where int is expected in strict mode."""
+    with pytest.raises(ValidationError):
+        validate_with_sampling([1, True], list[int])
+
+
+def test_primitive_dict_fast_path():
+    """dict[str, int] validates via exact type checks on head and tail."""
+    data = {f"key_{i}": i for i in range(150)}
+    assert validate_with_sampling(data, dict[str, int]) == data
+
+    bad = dict(data)
+    bad["key_145"] = "not an int"  # type: ignore
+    with pytest.raises(ValidationError):
+        validate_with_sampling(bad, dict[str, int])
@@ -45,8 +45,14 @@ def test_anthropic_client_message_separation():
         mock_client.messages.create.assert_called_once()
         call_args = mock_client.messages.create.call_args
 
-        # Check that system message was passed separately
-        assert call_args[1]["system"] == "You are a helpful assistant."
+        # Check that system message was passed separately, marked for caching
+        assert call_args[1]["system"] == [
+            {
+                "type": "text",
+                "text": "You are a helpful assistant.",
+                "cache_control": {"type": "ephemeral"},
+            }
+        ]
 
         # Check that conversation messages were properly formatted
         conv_messages = call_args[1]["messages"]
@@ -96,4 +102,4 @@ def test_anthropic_client_multiple_system_messages():
         expected_system = (
             "You are a helpful assistant.\n\nYou are also very knowledgeable."
         )
-        assert call_args[1]["system"] == expected_system
+        assert call_args[1]["system"][0]["text"] == expected_system
@@ -0,0 +1,106 @@
+"""Tests for the response-caching client wrapper."""
+
+import pytest
+
+from agex.llm import CachedLLMClient
+from agex.llm.core import LLMResponse, TextMessage
+from agex.llm.dummy_client import DummyLLMClient
+from agex.state.kv import Memory
+
+
+def _messages(content: str) -> list:
+    return [
+        TextMessage(role="system", content="You are a helpful assistant."),
+        TextMessage(role="user", content=content),
+    ]
+
+
+def test_repeated_request_is_served_from_cache():
+    inner = DummyLLMClient(
+        responses=[
+            LLMResponse(thinking="first", code="x = 1"),
+            LLMResponse(thinking="second", code="x = 2"),
+        ]
+    )
+    client = CachedLLMClient(inner)
+
+    first = client.complete(_messages("hi"))
+    again = client.complete(_messages("hi"))
+
+    assert again == first
+    assert inner.call_count == 1
+    assert client.model == inner.model
+    assert client.provider_name == inner.provider_name
+
+
+def test_different_requests_miss():
+    inner = DummyLLMClient(
+        responses=[
+            LLMResponse(thinking="first", code="x = 1"),
+            LLMResponse(thinking="second", code="x = 2"),
+        ]
+    )
+    client = CachedLLMClient(inner)
+
+    assert client.complete(_messages("hi")).code == "x = 1"
+    assert client.complete(_messages("bye")).code == "x = 2"
+    assert client.complete(_messages("hi"), temperature=0).code == "x = 1"
+    assert inner.call_count == 3
+
+
+def test_failures_are_not_cached():
+    inner = DummyLLMClient(
+        responses=[RuntimeError("boom"), LLMResponse(thinking="ok", code="pass")]
+    )
+    store = Memory()
+    client = CachedLLMClient(inner, store=store)
+
+    with pytest.raises(RuntimeError):
+        client.complete(_messages("hi"))
+    assert not store.memory
+
+    assert client.complete(_messages("hi")).code == "pass"
+    assert len(store.memory) == 1
+
+
+def test_nonzero_temperature_bypasses_cache():
+    inner = DummyLLMClient(
+        responses=[
+            LLMResponse(thinking="first", code="x = 1"),
+            LLMResponse(thinking="second", code="x = 2"),
+        ]
+    )
+    store = Memory()
+    client = CachedLLMClient(inner, store=store)
+
+    assert client.complete(_messages("hi"), temperature=0.7).code == "x = 1"
+    assert client.complete(_messages("hi"), temperature=0.7).code == "x = 2"
+    assert not store.memory
+
+    # A temperature set on the wrapped client at construction counts too
+    inner._kwargs = {"temperature": 0.9}
+    client.complete(_messages("hi"))
+    client.complete(_messages("hi"))
+    assert inner.call_count == 4
+    assert not store.memory
+
+
+def test_client_settings_are_part_of_the_key():
+    store = Memory()
+    short = DummyLLMClient(responses=[LLMResponse(thinking="short", code="x = 1")])
+    short._kwargs = {"max_tokens": 100}
+    long = DummyLLMClient(responses=[LLMResponse(thinking="long", code="x = 2")])
+    long._kwargs = {"max_tokens": 200}
+
+    assert CachedLLMClient(short, store).complete(_messages("hi")).code == "x = 1"
+    assert CachedLLMClient(long, store).complete(_messages("hi")).code == "x = 2"
+    assert len(store.memory) == 2
+
+
+def test_non_json_kwargs_are_rejected():
+    inner = DummyLLMClient()
+    client = CachedLLMClient(inner)
+
+    with pytest.raises(TypeError, match="JSON-serializable"):
+        client.complete(_messages("hi"), stop=object())
+    assert inner.call_count == 0
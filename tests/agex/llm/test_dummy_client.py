@@ -0,0 +1,33 @@
+"""Tests for the scripted DummyLLMClient."""
+
+import pytest
+
+from agex.llm.core import LLMResponse, TextMessage
+from agex.llm.dummy_client import DummyLLMClient
+
+MESSAGES = [TextMessage(role="user", content="hi")]
+
+
+def test_responses_cycle_without_consuming_the_script():
+    """Responses are served by index and wrap around once exhausted."""
+    first = LLMResponse(thinking="one", code="x = 1")
+    second = LLMResponse(thinking="two", code="x = 2")
+    client = DummyLLMClient(responses=[first, second])
+
+    codes = [client.complete(MESSAGES).code for _ in range(5)]
+
+    assert codes == ["x = 1", "x = 2", "x = 1", "x = 2", "x = 1"]
+    assert client.call_count == 5
+    # Callers get copies, so the scripted responses are never mutated
+    assert client.complete(MESSAGES) is not client.responses[1]
+
+
+def test_scripted_exceptions_are_raised():
+    """Exception entries simulate client failures in sequence."""
+    client = DummyLLMClient(
+        responses=[RuntimeError("boom"), LLMResponse(thinking="ok", code="pass")]
+    )
+
+    with pytest.raises(RuntimeError, match="boom"):
+        client.complete(MESSAGES)
+    assert client.complete(MESSAGES).code == "pass"
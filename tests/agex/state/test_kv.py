@@ -36,6 +36,16 @@ class TestMemory:
         result = store.get_many("key1", "key3", "nonexistent")
         assert dict(result) == {"key1": b"value1", "key3": b"value3"}
 
+    def test_memory_clear(self):
+        store = Memory()
+        store.set_many(key1=b"value1", key2=b"value2")
+
+        store.clear()
+
+        assert store.get("key1") is None
+        assert "key2" not in store
+        assert dict(store.items()) == {}
+
 
 class TestCache:
     """Test the Cache write-through cache."""
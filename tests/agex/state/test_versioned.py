@@ -1,3 +1,5 @@
+import pickle
+
 from agex.state import kv
 from agex.state.versioned import Versioned
 
@@ -181,3 +183,58 @@ def test_mutation_detection_with_nested_objects():
     old_data = old_state.get("app_data")
     assert old_data["users"][0]["scores"] == [10, 20]
     assert "timeout" not in old_data["config"]
+
+
+def test_repeated_reads_share_tracked_object():
+    """Repeated reads before a snapshot return the already-loaded object."""
+    store = kv.Memory()
+    state = Versioned(store)
+
+    state.set("my_list", [1, 2, 3])
+    state.snapshot()
+
+    first = state.get("my_list")
+    second = state.get("my_list")
+    assert first is second
+
+    # A mutation through the second reference is still detected
+    second.append(4)
+    state.snapshot()
+    assert state.get("my_list") == [1, 2, 3, 4]
+
+
+def test_values_from_older_stores_are_not_flagged_as_mutated():
+    """Bytes written with the default pickle protocol read back as unchanged."""
+    store = kv.Memory()
+    state = Versioned(store)
+    state.set("config", {"a": [1, 2], "b": "text"})
+    state.snapshot()
+
+    # Rewrite the stored bytes the way earlier releases pickled them
+    versioned_key = state.commit_keys["config"]
+    store.set(versioned_key, pickle.dumps({"a": [1, 2], "b": "text"}))
+
+    reader = Versioned(store, commit_hash=state.current_commit)
+    assert reader.get("config") == {"a": [1, 2], "b": "text"}
+    assert reader._detect_mutations() == ({}, [])
+
+
+def test_initial_commit_written_with_first_snapshot():
+    """A fresh state writes nothing until its first non-empty snapshot."""
+    store = kv.Memory()
+    state = Versioned(store)
+    initial = state.current_commit
+    assert not store.memory
+
+    # An empty snapshot still creates no commit
+    state.snapshot()
+    assert not store.memory
+
+    state.set("x", 1)
+    state.snapshot()
+
+    # The initial commit is now part of the recorded history and checks out
+    assert list(state.history()) == [state.current_commit, initial]
+    initial_state = state.checkout(initial)
+    assert initial_state is not None
+    assert "x" not in initial_state
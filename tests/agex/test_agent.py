@@ -35,6 +35,69 @@ def test_view_image_primer_text_is_always_visible():
     assert "numpy.ndarray" in system_message
 
 
+def test_system_message_is_reused_until_registrations_change():
+    """The rendered system message is cached but reflects later registrations."""
+    agent = Agent(primer="Be brief.")
+    first = agent._build_system_message()
+    assert agent._build_system_message() is first
+
+    @agent.fn()
+    def late_addition():
+        """Registered after the first render."""
+        return 1
+
+    updated = agent._build_system_message()
+    assert "late_addition" in updated
+
+    agent.primer = "Be thorough."
+    assert "Be thorough." in agent._build_system_message()
+
+
+def test_system_message_reflects_reregistered_signature():
+    """Re-registering a function with a new signature refreshes the message."""
+    agent = Agent()
+
+    def tool(x: int) -> int:
+        """Same docstring."""
+        return x
+
+    agent.fn(tool)
+    assert "y: str" not in agent._build_system_message()
+
+    def tool(x: int, y: str) -> int:  # noqa: F811
+        """Same docstring."""
+        return x
+
+    agent.fn(tool)
+    assert "y: str" in agent._build_system_message()
+
+
+def test_fingerprint_recomputed_lazily_after_registrations(monkeypatch):
+    """Registrations only invalidate; the next read rehashes and registers."""
+    import agex.agent.base as base
+
+    agent = Agent()
+    initial = agent.fingerprint
+
+    calls = []
+    original = base.compute_agent_fingerprint_from_policy
+    monkeypatch.setattr(
+        base,
+        "compute_agent_fingerprint_from_policy",
+        lambda a: calls.append(a) or original(a),
+    )
+
+    for i in range(5):
+        agent.fn(lambda: i, name=f"helper_{i}")
+    assert calls == []
+
+    updated = agent.fingerprint
+    assert updated != initial
+    assert agent.fingerprint is updated
+    assert len(calls) == 1
+    assert base.resolve_agent(updated) is agent
+
+
 def test_agent_fn_registration_decorator():
     agent = Agent()
 
@@ -378,7 +441,9 @@ def test_task_decorator_single():
         pass
 
     # Check that task metadata is set correctly
-    assert hasattr(simple_task, "__agex_task_namespace__")
+    assert simple_task.__agex_meta__.namespace == agent.name
+    assert not simple_task.__agex_meta__.is_fn
+    # Deprecated read-only alias
     assert simple_task.__agex_task_namespace__ == agent.name
 
 
@@ -394,12 +459,12 @@ def test_fn_decorator_multiple():
         return "shared"
 
     # Check that fn metadata is set correctly
-    assert hasattr(shared_function, "__is_agent_fn__")
-    assert shared_function.__is_agent_fn__ is True
-    assert hasattr(shared_function, "__agent_fn_owners__")
-    assert len(shared_function.__agent_fn_owners__) == 2
-    assert agent1 in shared_function.__agent_fn_owners__
-    assert agent2 in shared_function.__agent_fn_owners__
+    meta = shared_function.__agex_meta__
+    assert meta.is_fn is True
+    assert meta.namespace is None
+    assert len(meta.owners) == 2
+    assert agent1 in meta.owners
+    assert agent2 in meta.owners
 
 
 def test_task_decorator_multiple_not_allowed():
@@ -444,17 +509,16 @@ def test_decorator_order_correct_allowed():
         pass
 
     # Check that both decorators were applied
-    assert hasattr(correct_order_example, "__agex_task_namespace__")
-    assert (
-        correct_order_example.__agex_task_namespace__ == agent2.name
-    )  # agent2's class name
+    meta = correct_order_example.__agex_meta__
+    assert meta.is_fn is True
+    assert meta.namespace == agent2.name  # agent2's class name
 
 
 def test_fn_decorator_builtin_functions():
     """Test that fn decorator works with built-in functions without errors."""
     agent = Agent()
 
-    # This should not raise any AttributeError about setting __agent_fn_owners__
+    # This should not raise any AttributeError about setting __agex_meta__
     registered_sqrt = agent.fn(docstring="Built-in square root")(math.sqrt)
 
     # Should be the same function object
@@ -529,15 +593,14 @@ def test_dual_decorator_namespace_setting():
         pass
 
     # Verify namespace is set correctly
-    assert hasattr(dual_function, "__agex_task_namespace__")
-    assert dual_function.__agex_task_namespace__ == "specialist"
+    assert dual_function.__agex_meta__.namespace == "specialist"
 
     # Verify it's registered in the fn decorator's agent via policy
     main = orchestrator._policy.namespaces.get("__main__")
     assert main is not None and "dual_function" in main.fns
 
     # Verify dual-decorator metadata (namespace is sufficient)
-    # The __agex_task_namespace__ attribute serves as both the task marker and namespace
+    # The __agex_meta__ namespace serves as both the task marker and namespace
 
 
 def test_namespaced_state_isolation():
@@ -614,6 +677,27 @@ def test_task_input_dataclass_pickling():
     assert len(snapshot_hash) > 0
 
 
+def test_task_input_dataclass_loads_legacy_pickle():
+    """Test that task inputs pickled by earlier releases still load."""
+    clear_agent_registry()
+    agent = Agent(name="legacy_agent", llm_client=DummyLLMClient())
+
+    @agent.task("Add.")
+    def legacy_add(x: int, y: int = 2) -> int:  # type: ignore
+        """Add two numbers."""
+        pass
+
+    # Instance-dict pickle of LegacyAddInputs(x=1, y=2) from an earlier release
+    blob = (
+        b"\x80\x05\x95;\x00\x00\x00\x00\x00\x00\x00\x8c\x0fagex.agent.task\x94"
+        b"\x8c\x0fLegacyAddInputs\x94\x93\x94)\x81\x94}\x94(\x8c\x01x\x94K\x01"
+        b"\x8c\x01y\x94K\x02ub."
+    )
+    inputs = pickle.loads(blob)
+    assert inputs.x == 1
+    assert inputs.y == 2
+
+
 def test_unserializable_object_in_state_is_handled_gracefully():
     """
     Test that if an unserializable object (like a lambda) is added to state
@@ -7,17 +7,104 @@ This module tests the complete dual-decorator workflow:
 - Complex multi-step workflows with multiple specialists
 """
 
+import pytest
+
 from agex import Agent, clear_agent_registry
 from agex.llm.core import LLMResponse
 from agex.llm.dummy_client import DummyLLMClient
 from agex.state import Versioned
 from agex.state.kv import Memory
 
+# Scripted responses are immutable, so they live at module scope and are
+# shared by reference rather than rebuilt on every test run.
+_MATH_CALCULATOR_RESPONSES = (
+    LLMResponse(
+        thinking='I need to evaluate the expression "15 + 25 * 2". Following order of operations, multiplication comes first.\n25 * 2 = 50\n15 + 50 = 65',
+        code="result = 25 * 2  # 50\nresult = 15 + result  # 65\ntask_success(65.0)",
+    ),
+)
+
+_MATH_VALIDATOR_RESPONSES = (
+    LLMResponse(
+        thinking='I need to check if 65.0 is a reasonable result for "15 + 25 * 2".\nLet me verify: 25 * 2 = 50, then 15 + 50 = 65. Yes, this is correct.',
+        code='# Check the calculation step by step\nexpected = 15 + (25 * 2)  # Order of operations: multiply first\nprint(f"Expected result: {expected}")\nprint(f"Actual result: {inputs.result}")\n\n# The result is correct\nis_valid = (inputs.result == expected)\ntask_success(is_valid)',
+    ),
+)
+
+_MATH_ORCHESTRATOR_RESPONSES = (
+    LLMResponse(
+        thinking="I need to solve this math problem step by step:\n1. First calculate the expression using the calculator\n2. Then validate the result with the validator\n3. Return a summary",
+        code='# Step 1: Calculate the expression\nexpression = "15 + 25 * 2"\ncalc_result = calculate(expression)\nprint(f"Calculator returned: {calc_result}")\n\n# Step 2: Validate the result\nis_valid = validate_result(expression, calc_result)\nprint(f"Validator returned: {is_valid}")\n\n# Step 3: Return summary\nsummary = {\n    "expression": expression,\n    "result": calc_result,\n    "validated": is_valid,\n    "status": "success" if is_valid else "error"\n}\n\ntask_success(summary)',
+    ),
+)
+
+_PIPELINE_PROCESSOR_RESPONSES = (
+    LLMResponse(
+        thinking="I need to clean the raw data by removing invalid entries and normalizing values.",
+        code="# Clean the data\ncleaned_data = []\nfor item in inputs.raw_data:\n    if isinstance(item, (int, float)) and item > 0:\n        cleaned_data.append(float(item))\n\n# Store intermediate result in my namespace\ntask_success(cleaned_data)",
+    ),
+)
+
+_PIPELINE_ANALYZER_RESPONSES = (
+    LLMResponse(
+        thinking="I need to analyze the processed data and generate insights.",
+        code='# Analyze the data\ndata = inputs.processed_data\nif data:\n    mean_value = sum(data) / len(data)\n    max_value = max(data)\n    min_value = min(data)\n    \n    insights = {\n        "count": len(data),\n        "mean": mean_value,\n        "max": max_value,\n        "min": min_value,\n        "range": max_value - min_value\n    }\nelse:\n    insights = {"error": "No valid data to analyze"}\n\ntask_success(insights)',
+    ),
+)
+
+_PIPELINE_COORDINATOR_RESPONSES = (
+    LLMResponse(
+        thinking="I need to coordinate the data pipeline by calling the specialist functions in sequence.",
+        code='# Step 1: Process the raw data\nprocessed = process_data(inputs.raw_data)\nprint(f"Data processor returned: {processed}")\n\n# Step 2: Analyze the processed data\nanalysis = analyze_data(processed)\nprint(f"Analyzer returned: {analysis}")\n\n# Step 3: Combine results\nfinal_result = {\n    "raw_count": len(inputs.raw_data),\n    "processed_count": len(processed),\n    "analysis": analysis,\n    "pipeline_status": "completed"\n}\n\ntask_success(final_result)',
+    ),
+)
+
+_RISKY_WORKER_RESPONSES = (
+    LLMResponse(
+        thinking="The input says should_fail is False, so I should succeed.",
+        code='if inputs.should_fail:\n    task_fail("Operation failed as requested")\nelse:\n    task_success("Operation completed successfully")',
+    ),
+)
+
+_RISKY_ORCHESTRATOR_RESPONSES = (
+    LLMResponse(
+        thinking="I need to test the risky operation and handle any failures gracefully.",
+        code='try:\n    # First test - should succeed\n    result1 = risky_operation(should_fail=False)\n    print(f"Success case: {result1}")\n    \n    # Compile results\n    results = {\n        "success_case": result1,\n        "test_completed": True\n    }\n    \n    task_success(results)\n    \nexcept Exception as e:\n    # Handle any errors gracefully\n    error_result = {\n        "error": str(e),\n        "test_completed": False\n    }\n    task_success(error_result)',
+    ),
+)
+
+_ISOLATION_AGENT_A_RESPONSES = (
+    LLMResponse(
+        thinking="I'll store the data with a prefix for agent A.",
+        code='result = f"A:{inputs.data}"\ntask_success(result)',
+    ),
+)
+
+_ISOLATION_AGENT_B_RESPONSES = (
+    LLMResponse(
+        thinking="I'll store the data with a prefix for agent B.",
+        code='result = f"B:{inputs.data}"\ntask_success(result)',
+    ),
+)
+
+_ISOLATION_COORDINATOR_RESPONSES = (
+    LLMResponse(
+        thinking="I'll test namespace isolation by calling both functions with the same data.",
+        code='# Call both functions with the same data\nresult_a = store_in_a(inputs.test_data)\nresult_b = store_in_b(inputs.test_data)\n\n# Combine results\nfinal_result = {\n    "agent_a_result": result_a,\n    "agent_b_result": result_b,\n    "are_different": result_a != result_b\n}\n\ntask_success(final_result)',
+    ),
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_registry():
+    """Clear the agent registry before and after each test."""
+    clear_agent_registry()
+    yield
+    clear_agent_registry()
+
 
 def test_dual_decorator_math_workflow():
     """Test a realistic math workflow using orchestrator + specialist agents."""
-    clear_agent_registry()
-
     # Create specialist agents
     calculator = Agent(name="calculator")
     validator = Agent(name="validator")
@@ -42,32 +129,10 @@ def test_dual_decorator_math_workflow():
         """Solve a math problem using specialist agents."""
         pass
 
-    # Set up dummy LLM responses
-    calculator_responses = [
-        LLMResponse(
-            thinking='I need to evaluate the expression "15 + 25 * 2". Following order of operations, multiplication comes first.\n25 * 2 = 50\n15 + 50 = 65',
-            code="result = 25 * 2  # 50\nresult = 15 + result  # 65\ntask_success(65.0)",
-        )
-    ]
-
-    validator_responses = [
-        LLMResponse(
-            thinking='I need to check if 65.0 is a reasonable result for "15 + 25 * 2".\nLet me verify: 25 * 2 = 50, then 15 + 50 = 65. Yes, this is correct.',
-            code='# Check the calculation step by step\nexpected = 15 + (25 * 2)  # Order of operations: multiply first\nprint(f"Expected result: {expected}")\nprint(f"Actual result: {inputs.result}")\n\n# The result is correct\nis_valid = (inputs.result == expected)\ntask_success(is_valid)',
-        )
-    ]
-
-    orchestrator_responses = [
-        LLMResponse(
-            thinking="I need to solve this math problem step by step:\n1. First calculate the expression using the calculator\n2. Then validate the result with the validator\n3. Return a summary",
-            code='# Step 1: Calculate the expression\nexpression = "15 + 25 * 2"\ncalc_result = calculate(expression)\nprint(f"Calculator returned: {calc_result}")\n\n# Step 2: Validate the result\nis_valid = validate_result(expression, calc_result)\nprint(f"Validator returned: {is_valid}")\n\n# Step 3: Return summary\nsummary = {\n    "expression": expression,\n    "result": calc_result,\n    "validated": is_valid,\n    "status": "success" if is_valid else "error"\n}\n\ntask_success(summary)',
-        )
-    ]
-
     # Configure dummy LLMs for each agent
-    calculator.llm_client = DummyLLMClient(responses=calculator_responses)
-    validator.llm_client = DummyLLMClient(responses=validator_responses)
-    orchestrator.llm_client = DummyLLMClient(responses=orchestrator_responses)
+    calculator.llm_client = DummyLLMClient(responses=_MATH_CALCULATOR_RESPONSES)
+    validator.llm_client = DummyLLMClient(responses=_MATH_VALIDATOR_RESPONSES)
+    orchestrator.llm_client = DummyLLMClient(responses=_MATH_ORCHESTRATOR_RESPONSES)
 
     # Use a shared state object to inspect sub-agent stdout
     shared_state = Versioned(Memory())
@@ -104,8 +169,6 @@ def test_dual_decorator_math_workflow():
 
 def test_dual_decorator_state_sharing():
     """Test that dual-decorated functions properly share state via namespaces."""
-    clear_agent_registry()
-
     # Create agents
     data_processor = Agent(name="data_processor")
     analyzer = Agent(name="analyzer")
@@ -129,32 +192,10 @@ def test_dual_decorator_state_sharing():
         """Run the complete data processing pipeline."""
         pass
 
-    # Set up responses
-    processor_responses = [
-        LLMResponse(
-            thinking="I need to clean the raw data by removing invalid entries and normalizing values.",
-            code="# Clean the data\ncleaned_data = []\nfor item in inputs.raw_data:\n    if isinstance(item, (int, float)) and item > 0:\n        cleaned_data.append(float(item))\n\n# Store intermediate result in my namespace\ntask_success(cleaned_data)",
-        )
-    ]
-
-    analyzer_responses = [
-        LLMResponse(
-            thinking="I need to analyze the processed data and generate insights.",
-            code='# Analyze the data\ndata = inputs.processed_data\nif data:\n    mean_value = sum(data) / len(data)\n    max_value = max(data)\n    min_value = min(data)\n    \n    insights = {\n        "count": len(data),\n        "mean": mean_value,\n        "max": max_value,\n        "min": min_value,\n        "range": max_value - min_value\n    }\nelse:\n    insights = {"error": "No valid data to analyze"}\n\ntask_success(insights)',
-        )
-    ]
-
-    coordinator_responses = [
-        LLMResponse(
-            thinking="I need to coordinate the data pipeline by calling the specialist functions in sequence.",
-            code='# Step 1: Process the raw data\nprocessed = process_data(inputs.raw_data)\nprint(f"Data processor returned: {processed}")\n\n# Step 2: Analyze the processed data\nanalysis = analyze_data(processed)\nprint(f"Analyzer returned: {analysis}")\n\n# Step 3: Combine results\nfinal_result = {\n    "raw_count": len(inputs.raw_data),\n    "processed_count": len(processed),\n    "analysis": analysis,\n    "pipeline_status": "completed"\n}\n\ntask_success(final_result)',
-        )
-    ]
-
     # Configure LLMs
-    data_processor.llm_client = DummyLLMClient(responses=processor_responses)
-    analyzer.llm_client = DummyLLMClient(responses=analyzer_responses)
-    coordinator.llm_client = DummyLLMClient(responses=coordinator_responses)
+    data_processor.llm_client = DummyLLMClient(responses=_PIPELINE_PROCESSOR_RESPONSES)
+    analyzer.llm_client = DummyLLMClient(responses=_PIPELINE_ANALYZER_RESPONSES)
+    coordinator.llm_client = DummyLLMClient(responses=_PIPELINE_COORDINATOR_RESPONSES)
 
     # Test with shared state
     shared_state = Versioned(Memory())
@@ -224,8 +265,6 @@ def test_hierarchical_namespace_state_is_correct():
     This test verifies that state from a sub-agent is correctly saved under
     a hierarchical namespace (e.g., 'orchestrator/worker/key').
     """
-    clear_agent_registry()
-
     # Create two agents
     worker = Agent(name="worker")
     orchestrator = Agent(name="orchestrator")
@@ -281,8 +320,6 @@ def test_hierarchical_namespace_state_is_correct():
 
 def test_dual_decorator_error_handling():
     """Test error handling in dual-decorator workflows."""
-    clear_agent_registry()
-
     # Create agents
     risky_worker = Agent(name="risky_worker")
     orchestrator = Agent(name="orchestrator")
@@ -298,25 +335,9 @@ def test_dual_decorator_error_handling():
         """Coordinate risky operations with error handling."""
         pass
 
-    # Set up responses
-    risky_success_responses = [
-        LLMResponse(
-            thinking="The input says should_fail is False, so I should succeed.",
-            code='if inputs.should_fail:\n    task_fail("Operation failed as requested")\nelse:\n    task_success("Operation completed successfully")',
-        )
-    ]
-
-    # Orchestrator response
-    orchestrator_responses = [
-        LLMResponse(
-            thinking="I need to test the risky operation and handle any failures gracefully.",
-            code='try:\n    # First test - should succeed\n    result1 = risky_operation(should_fail=False)\n    print(f"Success case: {result1}")\n    \n    # Compile results\n    results = {\n        "success_case": result1,\n        "test_completed": True\n    }\n    \n    task_success(results)\n    \nexcept Exception as e:\n    # Handle any errors gracefully\n    error_result = {\n        "error": str(e),\n        "test_completed": False\n    }\n    task_success(error_result)',
-        )
-    ]
-
     # Configure LLMs
-    risky_worker.llm_client = DummyLLMClient(responses=risky_success_responses)
-    orchestrator.llm_client = DummyLLMClient(responses=orchestrator_responses)
+    risky_worker.llm_client = DummyLLMClient(responses=_RISKY_WORKER_RESPONSES)
+    orchestrator.llm_client = DummyLLMClient(responses=_RISKY_ORCHESTRATOR_RESPONSES)
 
     # Test the workflow
     result = safe_coordinator(test_mode="success_test")
@@ -329,8 +350,6 @@ def test_dual_decorator_error_handling():
 
 def test_dual_decorator_namespace_isolation():
     """Test that different specialist agents have isolated namespaces."""
-    clear_agent_registry()
-
     # Create agents with separate namespaces
     agent_a = Agent(name="agent_a")
     agent_b = Agent(name="agent_b")
@@ -353,32 +372,10 @@ def test_dual_decorator_namespace_isolation():
         """Test namespace isolation and state sharing."""
         pass
 
-    # Set up responses
-    agent_a_responses = [
-        LLMResponse(
-            thinking="I'll store the data with a prefix for agent A.",
-            code='result = f"A:{inputs.data}"\ntask_success(result)',
-        )
-    ]
-
-    agent_b_responses = [
-        LLMResponse(
-            thinking="I'll store the data with a prefix for agent B.",
-            code='result = f"B:{inputs.data}"\ntask_success(result)',
-        )
-    ]
-
-    coordinator_responses = [
-        LLMResponse(
-            thinking="I'll test namespace isolation by calling both functions with the same data.",
-            code='# Call both functions with the same data\nresult_a = store_in_a(inputs.test_data)\nresult_b = store_in_b(inputs.test_data)\n\n# Combine results\nfinal_result = {\n    "agent_a_result": result_a,\n    "agent_b_result": result_b,\n    "are_different": result_a != result_b\n}\n\ntask_success(final_result)',
-        )
-    ]
-
     # Configure LLMs
-    agent_a.llm_client = DummyLLMClient(responses=agent_a_responses)
-    agent_b.llm_client = DummyLLMClient(responses=agent_b_responses)
-    coordinator.llm_client = DummyLLMClient(responses=coordinator_responses)
+    agent_a.llm_client = DummyLLMClient(responses=_ISOLATION_AGENT_A_RESPONSES)
+    agent_b.llm_client = DummyLLMClient(responses=_ISOLATION_AGENT_B_RESPONSES)
+    coordinator.llm_client = DummyLLMClient(responses=_ISOLATION_COORDINATOR_RESPONSES)
 
     # Test the workflow
     shared_state = Versioned(Memory())
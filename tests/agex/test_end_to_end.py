@@ -16,17 +16,99 @@ from agex import Agent, TaskClarify, TaskFail, TaskTimeout
 from agex.llm import DummyLLMClient
 from agex.llm.core import LLMResponse
 
+# Each test replays a fixed script, so the responses are built once at import.
+_SUCCESSFUL_TASK_COMPLETION_RESPONSES = (
+    LLMResponse(
+        thinking="I need to solve this math problem by adding the numbers and multiplying by 2.",
+        code="sum_result = add(inputs.x, inputs.y)\nfinal_result = multiply(sum_result, 2)\ntask_success(final_result)",
+    ),
+)
+
+# First response is malformed (missing thinking section), second is correct
+_TASK_WITH_PARSE_ERROR_RECOVERY_RESPONSES = (
+    LLMResponse(
+        thinking="",
+        code="# This response has no thinking section - should trigger parse error\nresult = get_answer()",
+    ),
+    LLMResponse(
+        thinking="I'll call the function to get the answer.",
+        code="result = get_answer()\ntask_success(result)",
+    ),
+)
+
+# First response has a syntax error, second is correct
+_TASK_WITH_EVALUATION_ERROR_RECOVERY_RESPONSES = (
+    LLMResponse(
+        thinking="I'll try to compute something.",
+        code="# This will cause a syntax error\nresult = 1 + ",
+    ),
+    LLMResponse(
+        thinking="Let me fix that syntax error.",
+        code="result = 1 + 1\ntask_success(result)",
+    ),
+)
+
+_TASK_WITH_INPUTS_ACCESS_RESPONSES = (
+    LLMResponse(
+        thinking="I need to process the input data.",
+        code="message = inputs.text.upper()\ncount = inputs.repeat_count\nresult = message * count\ntask_success(result)",
+    ),
+)
+
+_TASK_TIMEOUT_AFTER_MAX_ITERATIONS_RESPONSES = (
+    LLMResponse(
+        thinking="I'll do some work but not finish.",
+        code='x = 1 + 1\nprint(f"Current value: {x}")',
+    ),
+)
+
+_TASK_WITH_TASK_FAIL_RESPONSES = (
+    LLMResponse(
+        thinking="I cannot complete this task.",
+        code='task_fail("Task is impossible to complete")',
+    ),
+)
+
+_CLARIFICATION_MESSAGE = "Please provide more details."
+_TASK_WITH_TASK_CLARIFY_RESPONSES = (
+    LLMResponse(
+        thinking="I need more information to proceed.",
+        code=f'task_clarify("{_CLARIFICATION_MESSAGE}")',
+    ),
+)
+
+_TASK_WITH_NO_INPUTS_RESPONSES = (
+    LLMResponse(
+        thinking="This is a simple task with no inputs.",
+        code='result = "Hello, World!"\ntask_success(result)',
+    ),
+)
+
+_TASK_WITH_COMPLEX_RETURN_TYPE_RESPONSES = (
+    LLMResponse(
+        thinking="I'll create a dictionary with the requested data.",
+        code='result = {"name": inputs.name, "age": inputs.age, "status": "processed"}\ntask_success(result)',
+    ),
+)
+
+_AGENT_FUNCTION_VISIBILITY_IN_TASK_RESPONSES = (
+    LLMResponse(
+        thinking="I'll use the factorial function to compute the result.",
+        code="result = calculate_factorial(inputs.number)\ntask_success(result)",
+    ),
+)
+
+_TASK_WITH_NO_RETURN_TYPE_RESPONSES = (
+    LLMResponse(
+        thinking="This task has no return type, so I'll just call task_success() with no arguments.",
+        code="print('Task completed successfully')\ntask_success()",
+    ),
+)
+
 
 def test_successful_task_completion():
     """Test complete task execution with successful result."""
-    # Define response that completes the task successfully
-    responses = [
-        LLMResponse(
-            thinking="I need to solve this math problem by adding the numbers and multiplying by 2.",
-            code="sum_result = add(inputs.x, inputs.y)\nfinal_result = multiply(sum_result, 2)\ntask_success(final_result)",
-        )
-    ]
-    llm_client = DummyLLMClient(responses=responses)
+    llm_client = DummyLLMClient(responses=_SUCCESSFUL_TASK_COMPLETION_RESPONSES)
 
     # Create agent with registered functions
     agent = Agent(
@@ -72,19 +154,7 @@ def test_successful_task_completion():
 
 def test_task_with_parse_error_recovery():
     """Test that tasks can recover from malformed LLM responses."""
-    # First response is malformed (missing thinking section)
-    # Second response is correct
-    responses = [
-        LLMResponse(
-            thinking="",
-            code="# This response has no thinking section - should trigger parse error\nresult = get_answer()",
-        ),
-        LLMResponse(
-            thinking="I'll call the function to get the answer.",
-            code="result = get_answer()\ntask_success(result)",
-        ),
-    ]
-    llm_client = DummyLLMClient(responses=responses)
+    llm_client = DummyLLMClient(responses=_TASK_WITH_PARSE_ERROR_RECOVERY_RESPONSES)
     agent = Agent(max_iterations=3, llm_client=llm_client)
 
     @agent.fn()
@@ -109,19 +179,9 @@ def test_task_with_parse_error_recovery():
 
 def test_task_with_evaluation_error_recovery():
     """Test that tasks can recover from evaluation errors."""
-    # First response has a syntax error
-    # Second response is correct
-    responses = [
-        LLMResponse(
-            thinking="I'll try to compute something.",
-            code="# This will cause a syntax error\nresult = 1 + ",
-        ),
-        LLMResponse(
-            thinking="Let me fix that syntax error.",
-            code="result = 1 + 1\ntask_success(result)",
-        ),
-    ]
-    llm_client = DummyLLMClient(responses=responses)
+    llm_client = DummyLLMClient(
+        responses=_TASK_WITH_EVALUATION_ERROR_RECOVERY_RESPONSES
+    )
     agent = Agent(max_iterations=3, llm_client=llm_client)
 
     @agent.task("Compute a simple result.")
@@ -140,13 +200,7 @@ def test_task_with_evaluation_error_recovery():
 
 def test_task_with_inputs_access():
     """Test that tasks can access their input parameters."""
-    responses = [
-        LLMResponse(
-            thinking="I need to process the input data.",
-            code="message = inputs.text.upper()\ncount = inputs.repeat_count\nresult = message * count\ntask_success(result)",
-        )
-    ]
-    llm_client = DummyLLMClient(responses=responses)
+    llm_client = DummyLLMClient(responses=_TASK_WITH_INPUTS_ACCESS_RESPONSES)
     agent = Agent(max_iterations=2, llm_client=llm_client)
 
     @agent.task("Process text input by transforming and repeating it.")
@@ -170,13 +224,7 @@ def test_task_with_inputs_access():
 def test_task_timeout_after_max_iterations():
     """Test that tasks timeout if they exceed max iterations."""
     # Response that never calls task_success
-    responses = [
-        LLMResponse(
-            thinking="I'll do some work but not finish.",
-            code='x = 1 + 1\nprint(f"Current value: {x}")',
-        )
-    ]
-    llm_client = DummyLLMClient(responses=responses)
+    llm_client = DummyLLMClient(responses=_TASK_TIMEOUT_AFTER_MAX_ITERATIONS_RESPONSES)
     agent = Agent(max_iterations=2, llm_client=llm_client)
 
     @agent.task("A task that never completes.")
@@ -196,13 +244,7 @@ def test_task_timeout_after_max_iterations():
 
 def test_task_with_task_fail():
     """Test that TaskFail exceptions are properly propagated."""
-    responses = [
-        LLMResponse(
-            thinking="I cannot complete this task.",
-            code='task_fail("Task is impossible to complete")',
-        )
-    ]
-    llm_client = DummyLLMClient(responses=responses)
+    llm_client = DummyLLMClient(responses=_TASK_WITH_TASK_FAIL_RESPONSES)
     agent = Agent(max_iterations=2, llm_client=llm_client)
 
     @agent.task("A task that always fails.")
@@ -227,14 +269,7 @@ def test_task_with_task_fail():
 
 def test_task_with_task_clarify():
     """Test that TaskClarify exceptions are properly propagated."""
-    clarification_message = "Please provide more details."
-    responses = [
-        LLMResponse(
-            thinking="I need more information to proceed.",
-            code=f'task_clarify("{clarification_message}")',
-        )
-    ]
-    llm_client = DummyLLMClient(responses=responses)
+    llm_client = DummyLLMClient(responses=_TASK_WITH_TASK_CLARIFY_RESPONSES)
     agent = Agent(max_iterations=2, llm_client=llm_client)
 
     @agent.task("A task that requires clarification.")
@@ -248,18 +283,12 @@ def test_task_with_task_clarify():
     with pytest.raises(TaskClarify) as exc_info:
         needs_clarification_task()
 
-    assert exc_info.value.message == clarification_message
+    assert exc_info.value.message == _CLARIFICATION_MESSAGE
 
 
 def test_task_with_no_inputs():
     """Test tasks that don't require any input parameters."""
-    responses = [
-        LLMResponse(
-            thinking="This is a simple task with no inputs.",
-            code='result = "Hello, World!"\ntask_success(result)',
-        )
-    ]
-    llm_client = DummyLLMClient(responses=responses)
+    llm_client = DummyLLMClient(responses=_TASK_WITH_NO_INPUTS_RESPONSES)
     agent = Agent(max_iterations=2, llm_client=llm_client)
 
     @agent.task("Return a greeting.")
@@ -278,13 +307,7 @@ def test_task_with_no_inputs():
 
 def test_task_with_complex_return_type():
     """Test tasks that return complex data structures."""
-    responses = [
-        LLMResponse(
-            thinking="I'll create a dictionary with the requested data.",
-            code='result = {"name": inputs.name, "age": inputs.age, "status": "processed"}\ntask_success(result)',
-        )
-    ]
-    llm_client = DummyLLMClient(responses=responses)
+    llm_client = DummyLLMClient(responses=_TASK_WITH_COMPLEX_RETURN_TYPE_RESPONSES)
     agent = Agent(max_iterations=2, llm_client=llm_client)
 
     @agent.task("Create a profile dictionary.")
@@ -309,13 +332,7 @@ def test_task_with_complex_return_type():
 
 def test_agent_function_visibility_in_task():
     """Test that registered functions are available during task execution."""
-    responses = [
-        LLMResponse(
-            thinking="I'll use the factorial function to compute the result.",
-            code="result = calculate_factorial(inputs.number)\ntask_success(result)",
-        )
-    ]
-    llm_client = DummyLLMClient(responses=responses)
+    llm_client = DummyLLMClient(responses=_AGENT_FUNCTION_VISIBILITY_IN_TASK_RESPONSES)
     agent = Agent(max_iterations=2, llm_client=llm_client)
 
     # Register a helper function
@@ -345,13 +362,7 @@ def test_agent_function_visibility_in_task():
 
 def test_task_with_no_return_type():
     """Test that tasks with no return type annotation show proper task_success() instruction."""
-    responses = [
-        LLMResponse(
-            thinking="This task has no return type, so I'll just call task_success() with no arguments.",
-            code="print('Task completed successfully')\ntask_success()",
-        )
-    ]
-    llm_client = DummyLLMClient(responses=responses)
+    llm_client = DummyLLMClient(responses=_TASK_WITH_NO_RETURN_TYPE_RESPONSES)
     agent = Agent(max_iterations=2, llm_client=llm_client)
 
     @agent.task("Perform a task that doesn't return anything.")
@@ -377,15 +388,11 @@ def test_task_with_custom_class_return_type():
             self.rating = rating
             self.comment = comment
 
-    agent = Agent(max_iterations=2)
-
-    # We don't need to actually execute the task - just verify the message formatting
-    # Create a mock task message to test the formatting
-    from agex.agent.loop import TaskLoopMixin
+    # We don't need to actually execute the task - just verify the message formatting.
+    # The builder is a plain function, so no Agent is needed.
+    from agex.agent.task_messages import build_task_message
 
-    # Test the _build_task_message method directly
-    task_message = TaskLoopMixin._build_task_message(
-        agent,
+    task_message = build_task_message(
         docstring="Create a product review.",
         inputs_dataclass=type,  # dummy
         inputs_instance=None,
@@ -399,63 +406,28 @@ def test_task_with_custom_class_return_type():
     assert "<class" not in task_message
 
 
-def test_task_with_builtin_type_return_clean_display():
+@pytest.mark.parametrize(
+    "return_type, expected",
+    [
+        (str, "str"),
+        (int, "int"),
+        (list, "list"),
+        (list[int], "list[int]"),  # generic types keep their parameters
+    ],
+)
+def test_task_with_builtin_type_return_clean_display(return_type, expected):
     """Test that built-in types like str display cleanly in task messages."""
 
-    agent = Agent(max_iterations=2)
-
-    # Test the _build_task_message method directly for built-in types
-    from agex.agent.loop import TaskLoopMixin
-
-    # Test with str
-    task_message = TaskLoopMixin._build_task_message(
-        agent,
-        docstring="Return a greeting message.",
-        inputs_dataclass=type,  # dummy
-        inputs_instance=None,
-        return_type=str,
-    )
-
-    # Verify that the task message contains clean type name "str" not "<class 'str'>"
-    assert "task_success(result)" in task_message
-    assert "str" in task_message
-    assert "<class 'str'>" not in task_message
-
-    # Test with int
-    task_message = TaskLoopMixin._build_task_message(
-        agent,
-        docstring="Return a number.",
-        inputs_dataclass=type,  # dummy
-        inputs_instance=None,
-        return_type=int,
-    )
-
-    assert "task_success(result)" in task_message
-    assert "int" in task_message
-    assert "<class 'int'>" not in task_message
-
-    # Test with list
-    task_message = TaskLoopMixin._build_task_message(
-        agent,
-        docstring="Return a list.",
-        inputs_dataclass=type,  # dummy
-        inputs_instance=None,
-        return_type=list,
-    )
-
-    assert "task_success(result)" in task_message
-    assert "list" in task_message
-    assert "<class 'list'>" not in task_message
+    from agex.agent.task_messages import build_task_message
 
-    # Test with generic type list[int] - should preserve type parameters
-    task_message = TaskLoopMixin._build_task_message(
-        agent,
-        docstring="Return a list of integers.",
+    task_message = build_task_message(
+        docstring="Return a value.",
         inputs_dataclass=type,  # dummy
         inputs_instance=None,
-        return_type=list[int],
+        return_type=return_type,
     )
 
+    # Verify that the task message contains the clean type name, not "<class '...'>"
     assert "task_success(result)" in task_message
-    assert "list[int]" in task_message
+    assert f"`{expected}`" in task_message
     assert "<class" not in task_message
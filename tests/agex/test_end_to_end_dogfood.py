@@ -11,24 +11,16 @@ import pytest
 
 from agex import Agent, clear_agent_registry
 from agex.agent.base import resolve_agent
+from agex.agent.policy.describe import describe_namespace
 from agex.eval.functions import TaskUserFunction
 from agex.eval.objects import AgexModule
 from agex.llm.dummy_client import DummyLLMClient, LLMResponse
 
-
-@pytest.fixture(autouse=True)
-def clear_registry():
-    """Clear agent registry before each test."""
-    clear_agent_registry()
-
-
-def test_basic_agent_creation_in_agent():
-    """Test that an agent can create another agent and return a TaskUserFunction."""
-    # Set up LLM response
-    responses = [
-        LLMResponse(
-            thinking="I need to create a new agent and return a task function.",
-            code="""
+# Scripted architect responses, shared across runs (the client copies them).
+_CREATE_GREETER_RESPONSES = (
+    LLMResponse(
+        thinking="I need to create a new agent and return a task function.",
+        code="""
 # Create a new agent
 with Agent() as new_agent:
     # Define a function for the new agent
@@ -41,9 +33,101 @@ with Agent() as new_agent:
 
     task_success(task_fn)
 """,
-        )
-    ]
-    llm_client = DummyLLMClient(responses=responses)
+    ),
+)
+
+_CREATE_PROCESSOR_RESPONSES = (
+    LLMResponse(
+        thinking="I need to create a new agent and register the helper function with it.",
+        code="""
+# Use context manager to avoid pickle issues
+with Agent() as new_agent:
+    # Register the helper function from parent
+    new_agent.fn(helper, name="math_helper")
+    
+    # Extract fingerprint before leaving context
+    fingerprint = new_agent.fingerprint
+
+# Return the agent fingerprint so we can verify it
+task_success(fingerprint)
+""",
+    ),
+)
+
+_CREATE_MATH_AGENT_RESPONSES = (
+    LLMResponse(
+        thinking="I need to create a new agent and give it limited math access.",
+        code="""
+# Import the math module first
+import math
+
+# Use context manager to avoid pickle issues
+with Agent() as new_agent:
+    # Try to register math module with more permissions than parent had
+    # This should only get the intersection of what parent had and what we request
+    new_agent.module(math, include=["sin", "tan", "pi"], name="math")
+    
+    # Extract fingerprint before leaving context
+    fingerprint = new_agent.fingerprint
+
+task_success(fingerprint)
+""",
+    ),
+)
+
+_CREATE_GEOMETRY_SPECIALIST_RESPONSES = (
+    LLMResponse(
+        thinking="I need to create a specialized geometry agent with inherited capabilities.",
+        code="""
+# Import math module first  
+import math
+
+# Use context manager to avoid pickle issues
+with Agent() as geom_agent:
+    # Register the distance calculation function
+    geom_agent.fn(distance_calc, name="euclidean_distance")
+    
+    # Register math module (should inherit limited permissions)
+    geom_agent.module(math, include=["sin", "cos", "tan", "sqrt"], name="math")
+    
+    # Create a new task for this agent
+    def analyze_triangle(a: float, b: float, c: float) -> dict:
+        '''Analyze a triangle given its side lengths.'''
+        pass
+    
+    triangle_analyzer = geom_agent.task(analyze_triangle)
+    
+    # Extract data before leaving context
+    result = {
+        'agent_fingerprint': geom_agent.fingerprint,
+        'task_function': triangle_analyzer
+    }
+
+    task_success(result)
+""",
+    ),
+)
+
+_GET_MATH_MODULE_RESPONSES = (
+    LLMResponse(
+        thinking="I need to import math and return the math module.",
+        code="""
+import math
+task_success(math)
+""",
+    ),
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_registry():
+    """Clear agent registry before each test."""
+    clear_agent_registry()
+
+
+def test_basic_agent_creation_in_agent():
+    """Test that an agent can create another agent and return a TaskUserFunction."""
+    llm_client = DummyLLMClient(responses=_CREATE_GREETER_RESPONSES)
     # Create architect agent
     architect = Agent(name="architect", llm_client=llm_client)
     architect.cls(Agent, include=["__init__", "name", "task", "fingerprint"])
@@ -73,24 +157,7 @@ def test_user_function_registration():
         """Double a number."""
         pass  # Task functions must have empty bodies
 
-    responses = [
-        LLMResponse(
-            thinking="I need to create a new agent and register the helper function with it.",
-            code="""
-# Use context manager to avoid pickle issues
-with Agent() as new_agent:
-    # Register the helper function from parent
-    new_agent.fn(helper, name="math_helper")
-    
-    # Extract fingerprint before leaving context
-    fingerprint = new_agent.fingerprint
-
-# Return the agent fingerprint so we can verify it
-task_success(fingerprint)
-""",
-        )
-    ]
-    llm_client = DummyLLMClient(responses=responses)
+    llm_client = DummyLLMClient(responses=_CREATE_PROCESSOR_RESPONSES)
     # Create architect that can create agents and register functions
     architect = Agent(name="architect", llm_client=llm_client)
     architect.cls(Agent, include=["__init__", "name", "fn", "task", "fingerprint"])
@@ -118,27 +185,7 @@ def test_module_security_inheritance():
     parent = Agent(name="parent")
     parent.module(math, include=["sin", "cos", "pi"], name="math")
 
-    responses = [
-        LLMResponse(
-            thinking="I need to create a new agent and give it limited math access.",
-            code="""
-# Import the math module first
-import math
-
-# Use context manager to avoid pickle issues
-with Agent() as new_agent:
-    # Try to register math module with more permissions than parent had
-    # This should only get the intersection of what parent had and what we request
-    new_agent.module(math, include=["sin", "tan", "pi"], name="math")
-    
-    # Extract fingerprint before leaving context
-    fingerprint = new_agent.fingerprint
-
-task_success(fingerprint)
-""",
-        )
-    ]
-    llm_client = DummyLLMClient(responses=responses)
+    llm_client = DummyLLMClient(responses=_CREATE_MATH_AGENT_RESPONSES)
     # Create architect that can access the parent's math module
     architect = Agent(name="architect", llm_client=llm_client)
     architect.cls(Agent, include=["__init__", "name", "module", "task", "fingerprint"])
@@ -158,8 +205,6 @@ task_success(fingerprint)
     new_agent = resolve_agent(new_agent_fingerprint)
     ns = new_agent._policy.namespaces.get("math")
     assert ns is not None
-    from agex.agent.policy.describe import describe_namespace
-
     desc = describe_namespace(ns)
     keys = set(desc.keys())
     assert "sin" in keys
@@ -178,39 +223,7 @@ def test_comprehensive_dogfood_workflow():
         """Calculate Euclidean distance."""
         pass  # Task functions must have empty bodies
 
-    responses = [
-        LLMResponse(
-            thinking="I need to create a specialized geometry agent with inherited capabilities.",
-            code="""
-# Import math module first  
-import math
-
-# Use context manager to avoid pickle issues
-with Agent() as geom_agent:
-    # Register the distance calculation function
-    geom_agent.fn(distance_calc, name="euclidean_distance")
-    
-    # Register math module (should inherit limited permissions)
-    geom_agent.module(math, include=["sin", "cos", "tan", "sqrt"], name="math")
-    
-    # Create a new task for this agent
-    def analyze_triangle(a: float, b: float, c: float) -> dict:
-        '''Analyze a triangle given its side lengths.'''
-        pass
-    
-    triangle_analyzer = geom_agent.task(analyze_triangle)
-    
-    # Extract data before leaving context
-    result = {
-        'agent_fingerprint': geom_agent.fingerprint,
-        'task_function': triangle_analyzer
-    }
-
-    task_success(result)
-""",
-        )
-    ]
-    llm_client = DummyLLMClient(responses=responses)
+    llm_client = DummyLLMClient(responses=_CREATE_GEOMETRY_SPECIALIST_RESPONSES)
     # Create architect agent
     architect = Agent(name="architect", llm_client=llm_client)
     architect.cls(
@@ -242,8 +255,6 @@ with Agent() as geom_agent:
     # Verify module registration with security inheritance (policy)
     ns = geom_agent._policy.namespaces.get("math")
     assert ns is not None
-    from agex.agent.policy.describe import describe_namespace
-
     keys = set(describe_namespace(ns).keys())
     assert {"sin", "cos", "sqrt"}.issubset(keys)
     assert "tan" not in keys
@@ -257,17 +268,7 @@ with Agent() as geom_agent:
 
 def test_agex_module_fingerprinting():
     """Test that AgexModule objects get proper agent fingerprints."""
-    # Create a simple function that returns the math module
-    responses = [
-        LLMResponse(
-            thinking="I need to import math and return the math module.",
-            code="""
-import math
-task_success(math)
-""",
-        )
-    ]
-    llm_client = DummyLLMClient(responses=responses)
+    llm_client = DummyLLMClient(responses=_GET_MATH_MODULE_RESPONSES)
     agent = Agent(name="test_agent", llm_client=llm_client)
     agent.module(math, name="math")
 
@@ -9,6 +9,39 @@ from agex.llm.core import LLMResponse
 from agex.llm.dummy_client import DummyLLMClient
 from agex.state import Versioned
 
+# Scripts shared by the top-level and sub-agent variants of each test
+_CLARIFY_RESPONSES = (
+    LLMResponse(
+        thinking="I need more information.",
+        code="task_clarify('Please provide more details.')",
+    ),
+)
+
+_FAIL_RESPONSES = (
+    LLMResponse(
+        thinking="I cannot complete this task.",
+        code="task_fail('Invalid input format.')",
+    ),
+)
+
+_CALL_SUB_TASK_RESPONSES = (
+    LLMResponse(
+        thinking="I will call the sub-agent and see what happens.",
+        code="result = sub_task()",
+    ),
+)
+
+
+def _output_texts(output_events):
+    """Yield the first printed value of each output part, as text."""
+    for event in output_events:
+        for part in event.parts:
+            try:
+                first = part[0]
+            except (TypeError, LookupError):
+                continue  # Not indexable, or empty
+            yield str(first)
+
 
 @pytest.fixture(autouse=True)
 def clear_registry():
@@ -20,14 +53,7 @@ def clear_registry():
 
 def test_top_level_agent_raises_task_clarify():
     """Test that a top-level agent's TaskClarify is raised normally."""
-    llm_client = DummyLLMClient(
-        responses=[
-            LLMResponse(
-                thinking="I need more information.",
-                code="task_clarify('Please provide more details.')",
-            )
-        ]
-    )
+    llm_client = DummyLLMClient(responses=_CLARIFY_RESPONSES)
     agent = Agent(
         name="top_level",
         primer="You are a top-level agent.",
@@ -49,32 +75,19 @@ def test_top_level_agent_raises_task_clarify():
 
 def test_sub_agent_converts_task_clarify_to_eval_error():
     """Test that a sub-agent's TaskClarify becomes an EvalError in the parent's stdout."""
-    sub_agent_llm = DummyLLMClient(
-        responses=[
-            LLMResponse(
-                thinking="I need more information.",
-                code="task_clarify('Please provide more details.')",
-            )
-        ]
-    )
+    sub_agent_llm = DummyLLMClient(responses=_CLARIFY_RESPONSES)
     sub_agent = Agent(
         name="sub_agent",
         primer="You are a sub-agent.",
         llm_client=sub_agent_llm,
     )
 
-    parent_agent_llm = DummyLLMClient(
-        responses=[
-            LLMResponse(
-                thinking="I will call the sub-agent and see what happens.",
-                code="result = sub_task()",
-            )
-        ]
-    )
+    parent_agent_llm = DummyLLMClient(responses=_CALL_SUB_TASK_RESPONSES)
     parent_agent = Agent(
         name="parent",
         primer="You are a parent agent.",
         llm_client=parent_agent_llm,
+        max_iterations=1,  # One failed call is all the test needs to observe
     )
 
     # Register the sub-agent's task with the parent
@@ -96,7 +109,7 @@ def test_sub_agent_converts_task_clarify_to_eval_error():
     def capture_event(event):
         events_list.append(event)
 
-    # The parent should hit max iterations because it can't handle the EvalError
+    # The parent times out after its single iteration, having seen the EvalError
     try:
         parent_task(state=Versioned(), on_event=capture_event)
         assert False, "Expected TaskTimeout to be raised"
@@ -108,33 +121,17 @@ def test_sub_agent_converts_task_clarify_to_eval_error():
         assert len(output_events) > 0, "Expected at least one OutputEvent from parent"
 
         # Look for the EvalError message in the output events
-        found_eval_error = False
-        for event in output_events:
-            for part in event.parts:
-                if hasattr(part, "__iter__") and len(part) > 0:
-                    content = str(part[0])
-                    if (
-                        "Sub-agent needs clarification: Please provide more details"
-                        in content
-                    ):
-                        found_eval_error = True
-                        break
-            if found_eval_error:
-                break
+        found_eval_error = any(
+            "Sub-agent needs clarification: Please provide more details" in content
+            for content in _output_texts(output_events)
+        )
 
         assert found_eval_error, f"Expected to find EvalError message in OutputEvents. Events: {[str(e) for e in output_events]}"
 
 
 def test_top_level_agent_raises_task_fail():
     """Test that a top-level agent's TaskFail is raised normally."""
-    llm_client = DummyLLMClient(
-        responses=[
-            LLMResponse(
-                thinking="I cannot complete this task.",
-                code="task_fail('Invalid input format.')",
-            )
-        ]
-    )
+    llm_client = DummyLLMClient(responses=_FAIL_RESPONSES)
     agent = Agent(
         name="top_level",
         primer="You are a top-level agent.",
@@ -156,32 +153,19 @@ def test_top_level_agent_raises_task_fail():
 
 def test_sub_agent_converts_task_fail_to_eval_error():
     """Test that a sub-agent's TaskFail becomes an EvalError in the parent's stdout."""
-    sub_agent_llm = DummyLLMClient(
-        responses=[
-            LLMResponse(
-                thinking="I cannot complete this task.",
-                code="task_fail('Invalid input format.')",
-            )
-        ]
-    )
+    sub_agent_llm = DummyLLMClient(responses=_FAIL_RESPONSES)
     sub_agent = Agent(
         name="sub_agent",
         primer="You are a sub-agent.",
         llm_client=sub_agent_llm,
     )
 
-    parent_agent_llm = DummyLLMClient(
-        responses=[
-            LLMResponse(
-                thinking="I will call the sub-agent and see what happens.",
-                code="result = sub_task()",
-            )
-        ]
-    )
+    parent_agent_llm = DummyLLMClient(responses=_CALL_SUB_TASK_RESPONSES)
     parent_agent = Agent(
         name="parent",
         primer="You are a parent agent.",
         llm_client=parent_agent_llm,
+        max_iterations=1,  # One failed call is all the test needs to observe
     )
 
     # Register the sub-agent's task with the parent
@@ -203,7 +187,7 @@ def test_sub_agent_converts_task_fail_to_eval_error():
     def capture_event(event):
         events_list.append(event)
 
-    # The parent should hit max iterations because it can't handle the EvalError
+    # The parent times out after its single iteration, having seen the EvalError
     try:
         parent_task(state=Versioned(), on_event=capture_event)
         assert False, "Expected TaskTimeout to be raised"
@@ -215,15 +199,9 @@ def test_sub_agent_converts_task_fail_to_eval_error():
         assert len(output_events) > 0, "Expected at least one OutputEvent from parent"
 
         # Look for the EvalError message in the output events
-        found_eval_error = False
-        for event in output_events:
-            for part in event.parts:
-                if hasattr(part, "__iter__") and len(part) > 0:
-                    content = str(part[0])
-                    if "Sub-agent failed: Invalid input format" in content:
-                        found_eval_error = True
-                        break
-            if found_eval_error:
-                break
+        found_eval_error = any(
+            "Sub-agent failed: Invalid input format" in content
+            for content in _output_texts(output_events)
+        )
 
         assert found_eval_error, f"Expected to find EvalError message in OutputEvents. Events: {[str(e) for e in output_events]}"
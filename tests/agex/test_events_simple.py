@@ -41,6 +41,20 @@ class TestEventsSimple:
         assert event.agent_name == "test_agent"
         assert event.parts == ["Test message"]
 
+    def test_event_log_is_not_mutated_in_place(self):
+        """Test that adding an event leaves previously read logs untouched."""
+        from agex.eval.builtins import _print_stateful
+        from agex.state import Live
+
+        state = Live()
+        _print_stateful("first", state=state, agent_name="test_agent")
+        earlier_log = state.get("__event_log__")
+        assert len(earlier_log) == 1
+
+        _print_stateful("second", state=state, agent_name="test_agent")
+        assert len(earlier_log) == 1
+        assert len(state.get("__event_log__")) == 2
+
     def test_basic_task_events(self):
         """Test that basic agent task execution generates expected events."""
         clear_agent_registry()